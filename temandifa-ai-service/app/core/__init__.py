@@ -30,11 +30,13 @@ from .http import (
 # Infrastructure submodule re-exports (backward compatibility)
 from .infrastructure import (
     ai_client,
+    cache_key_from_digest,
     clear_cache_by_prefix,
     generate_cache_key,
     get_cache_stats,
     get_cached,
     limiter,
+    rate_limit,
     set_cached,
 )
 from .logging import logger, setup_logging
@@ -45,11 +47,7 @@ from .performance import (
     CircuitBreaker,
     CircuitBreakerOpenError,
     DynamicBatcher,
-    MemoryPool,
-    audio_buffer,
-    get_all_pool_stats,
-    get_pool,
-    image_buffer,
+    inference_executor,
 )
 
 __all__ = [
@@ -70,7 +68,9 @@ __all__ = [
     # Infrastructure
     "ai_client",
     "limiter",
+    "rate_limit",
     "generate_cache_key",
+    "cache_key_from_digest",
     "get_cached",
     "set_cached",
     "clear_cache_by_prefix",
@@ -83,11 +83,7 @@ __all__ = [
     "validate_file_size",
     # Performance
     "DynamicBatcher",
-    "MemoryPool",
-    "get_pool",
-    "image_buffer",
-    "audio_buffer",
-    "get_all_pool_stats",
     "CircuitBreaker",
     "CircuitBreakerOpenError",
+    "inference_executor",
 ]
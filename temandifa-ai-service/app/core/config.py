@@ -21,7 +21,15 @@ class Settings(BaseSettings):
     yolo_device: str = "auto"  # Changed default to auto
     whisper_model: Literal["tiny", "base", "small", "medium", "large"] = "base"
     whisper_device: str = "auto"  # Added whisper device setting
+    # GPU only: INT8 weights with float16 activations instead of plain float16
+    whisper_int8_gpu: bool = True
+    # Copy of the Whisper model in shared memory (tmpfs), reused by later
+    # worker starts in the same container; empty loads from the disk cache
+    whisper_shm_dir: str = "/dev/shm/whisper"
     ocr_default_lang: str = "en"
+    # Text-direction classifier for rotated text; upright phone photos rarely
+    # need it and it adds a model pass per text line
+    ocr_use_angle_cls: bool = False
 
     max_image_size: int = 10 * 1024 * 1024
     max_audio_size: int = 25 * 1024 * 1024
@@ -36,8 +44,11 @@ class Settings(BaseSettings):
     ai_worker_threads: int = os.cpu_count() or 2
     temp_file_cleanup_delay: float = 0.5
 
+    # Token bucket: refills rate_limit_requests per rate_limit_window,
+    # holding at most rate_limit_burst tokens
     rate_limit_requests: int = 10
     rate_limit_window: str = "1 minute"
+    rate_limit_burst: int = 10
 
     log_level: str = "INFO"
     log_format: Literal["json", "text"] = "text"
@@ -58,12 +69,17 @@ class Settings(BaseSettings):
     # Model Quantization Settings
     enable_quantization: bool = False  # Use INT8 quantized models
     yolo_model_quantized: str = "models/yolov8n_int8.onnx"  # Path to quantized model
+    enable_fp16: bool = False  # Use FP16 YOLO model on CUDA (CPU stays FP32)
+    yolo_model_fp16: str = "models/yolov8n_fp16.onnx"  # Path to FP16 model
 
-    # Memory Pool Settings
-    memory_pool_enabled: bool = True
-    memory_pool_image_size: int = 10 * 1024 * 1024  # 10MB buffer for images
-    memory_pool_audio_size: int = 25 * 1024 * 1024  # 25MB buffer for audio
-    memory_pool_count: int = 4  # Number of buffers per pool
+    # TensorRT (CUDA only): engines are built on first load and cached. With
+    # enable_quantization, INT8 uses the calibration table in trt_cache_dir
+    enable_tensorrt: bool = False
+    trt_cache_dir: str = "models/trt_cache"
+
+    # ONNX Runtime Session Settings
+    # Save the optimized YOLO graph next to the model so restarts skip optimization
+    onnx_cache_optimized_model: bool = True
 
     # API Key Authentication
     api_key_enabled: bool = False
@@ -85,6 +101,15 @@ class Settings(BaseSettings):
     grpc_keepalive_time_ms: int = 30000  # 30 seconds
     grpc_keepalive_timeout_ms: int = 10000  # 10 seconds
     grpc_max_message_size: int = 50 * 1024 * 1024  # 50MB
+    # Extra worker listener for same-host clients; the HTTP layer talks to its
+    # worker over it instead of loopback TCP ("" disables)
+    grpc_unix_socket: str = "/tmp/temandifa-ai.sock"
+    # Only files under this directory are accepted as image_shm_path; kept
+    # apart from whisper_shm_dir so clients cannot read the model files
+    grpc_shm_dir: str = "/dev/shm/temandifa-images"
+    # Worker processes sharing port 50051 (SO_REUSEPORT); each loads its own
+    # models, so memory grows with this. The first one owns grpc_unix_socket
+    grpc_server_processes: int = 1
 
     ai_model_versions: dict = {
         "yolo": "yolov8n-8.1.0",
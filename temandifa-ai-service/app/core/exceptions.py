@@ -10,10 +10,17 @@ from fastapi.responses import JSONResponse
 class AIServiceException(Exception):
     """Base exception for AI Service errors."""
 
-    def __init__(self, message: str, code: str, status_code: int = 500):
+    def __init__(
+        self,
+        message: str,
+        code: str,
+        status_code: int = 500,
+        headers: dict[str, str] | None = None,
+    ):
         self.message = message
         self.code = code
         self.status_code = status_code
+        self.headers = headers
         super().__init__(self.message)
 
 
@@ -57,6 +64,18 @@ class InvalidFileTypeException(AIServiceException):
         )
 
 
+class RateLimitExceededException(AIServiceException):
+    """Raised when a client has exhausted its rate limit bucket."""
+
+    def __init__(self, retry_after: int):
+        super().__init__(
+            message=f"Rate limit exceeded. Retry after {retry_after}s.",
+            code="RATE_LIMIT_EXCEEDED",
+            status_code=429,
+            headers={"Retry-After": str(retry_after)},
+        )
+
+
 # Exception handlers for FastAPI
 async def ai_service_exception_handler(request: Request, exc: AIServiceException):
     """Handle AIServiceException and return structured JSON response."""
@@ -66,4 +85,5 @@ async def ai_service_exception_handler(request: Request, exc: AIServiceException
             "status": "error",
             "error": {"code": exc.code, "message": exc.message},
         },
+        headers=exc.headers,
     )
@@ -7,7 +7,11 @@ from .middleware import (
     TimeoutMiddleware,
 )
 from .security import require_api_key, verify_api_key
-from .upload import read_and_validate_audio, read_and_validate_image
+from .upload import (
+    read_and_validate_audio,
+    read_and_validate_image,
+    read_image_with_digest,
+)
 from .validation import validate_audio_file, validate_file_size, validate_image_file
 
 __all__ = [
@@ -19,6 +23,7 @@ __all__ = [
     "verify_api_key",
     "read_and_validate_image",
     "read_and_validate_audio",
+    "read_image_with_digest",
     "validate_image_file",
     "validate_audio_file",
     "validate_file_size",
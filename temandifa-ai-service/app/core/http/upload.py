@@ -3,12 +3,18 @@ File upload validation utilities.
 Consolidates common validation logic used across routers.
 """
 
+import hashlib
+from collections.abc import AsyncIterator
+
 from fastapi import UploadFile
 
 from app.core.config import settings
 from app.core.exceptions import FileTooLargeException
 from app.core.http.validation import validate_audio_file, validate_image_file
 
+# Read size for streaming uploads
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
 
 async def read_and_validate_image(
     file: UploadFile, max_size: int | None = None
@@ -47,6 +53,54 @@ async def read_and_validate_image(
     return contents
 
 
+async def iter_upload_chunks(
+    file: UploadFile, chunk_size: int = UPLOAD_CHUNK_SIZE
+) -> AsyncIterator[bytes]:
+    """Yield an uploaded file in fixed-size chunks."""
+    while chunk := await file.read(chunk_size):
+        yield chunk
+
+
+async def read_image_with_digest(
+    file: UploadFile, max_size: int | None = None
+) -> tuple[bytes, str]:
+    """
+    Read an uploaded image while hashing it, without validating the content.
+
+    Lets callers look up the cache by digest first and only run
+    validate_image_file on a miss (cached results always come from
+    previously validated uploads).
+
+    Args:
+        file: FastAPI UploadFile
+        max_size: Max file size in bytes (default: settings.max_image_size)
+
+    Returns:
+        Tuple of (file contents, SHA-256 hex digest)
+
+    Raises:
+        FileTooLargeException: If file exceeds size limit
+    """
+    if max_size is None:
+        max_size = settings.max_image_size
+
+    # Check file size
+    file.file.seek(0, 2)
+    file_size = file.file.tell()
+    file.file.seek(0)
+
+    if file_size > max_size:
+        raise FileTooLargeException(max_size // (1024 * 1024))
+
+    hasher = hashlib.sha256()
+    buffer = bytearray()
+    async for chunk in iter_upload_chunks(file):
+        hasher.update(chunk)
+        buffer += chunk
+
+    return bytes(buffer), hasher.hexdigest()
+
+
 async def read_and_validate_audio(
     file: UploadFile, max_size: int | None = None
 ) -> tuple[bytes, str]:
@@ -1,6 +1,7 @@
 """Infrastructure modules for AI Service."""
 
 from .cache import (
+    cache_key_from_digest,
     clear_cache_by_prefix,
     generate_cache_key,
     get_cache_stats,
@@ -8,12 +9,15 @@ from .cache import (
     set_cached,
 )
 from .grpc_client import ai_client
-from .rate_limiter import limiter
+from .rate_limiter import enforce_rate_limit, limiter, rate_limit
 
 __all__ = [
     "ai_client",
     "limiter",
+    "rate_limit",
+    "enforce_rate_limit",
     "generate_cache_key",
+    "cache_key_from_digest",
     "get_cached",
     "set_cached",
     "clear_cache_by_prefix",
@@ -74,8 +74,23 @@ def generate_cache_key(prefix: str, content: bytes) -> str:
     Returns:
         Cache key string
     """
-    hash_val = hashlib.sha256(content).hexdigest()[:32]
-    return f"ai:{prefix}:{hash_val}"
+    return cache_key_from_digest(prefix, hashlib.sha256(content).hexdigest())
+
+
+def cache_key_from_digest(prefix: str, digest: str) -> str:
+    """
+    Generate cache key from a precomputed SHA-256 hex digest.
+
+    Produces the same key as generate_cache_key for the same content.
+
+    Args:
+        prefix: Cache key prefix (e.g., 'detect', 'ocr', 'transcribe')
+        digest: SHA-256 hex digest of the content
+
+    Returns:
+        Cache key string
+    """
+    return f"ai:{prefix}:{digest[:32]}"
 
 
 def get_cached(key: str) -> dict | None:
@@ -7,6 +7,7 @@ Enhanced with request ID metadata propagation for distributed tracing.
 import grpc
 
 from app.core import logger
+from app.core.config import settings
 from app.grpc_generated import ai_service_pb2_grpc
 
 # gRPC channel options for performance and resilience
@@ -39,9 +40,19 @@ class AIClient:
         self.stub = None
         self._connected = False
 
+    @property
+    def target(self) -> str:
+        """
+        Channel target: the worker's unix socket when it runs on this host,
+        skipping loopback TCP, otherwise host:port.
+        """
+        if settings.grpc_unix_socket and self.host in ("localhost", "127.0.0.1"):
+            return f"unix://{settings.grpc_unix_socket}"
+        return f"{self.host}:{self.port}"
+
     async def connect(self):
         """Establish gRPC connection with optimized channel options."""
-        target = f"{self.host}:{self.port}"
+        target = self.target
         logger.info(f"Connecting to internal gRPC server at {target}")
         self.channel = grpc.aio.insecure_channel(target, options=GRPC_CHANNEL_OPTIONS)
         self.stub = ai_service_pb2_grpc.AIServiceStub(self.channel)
@@ -57,9 +68,8 @@ class AIClient:
     def get_stub(self):
         """Get the gRPC stub, connecting if necessary."""
         if self.stub is None:
-            target = f"{self.host}:{self.port}"
             self.channel = grpc.aio.insecure_channel(
-                target, options=GRPC_CHANNEL_OPTIONS
+                self.target, options=GRPC_CHANNEL_OPTIONS
             )
             self.stub = ai_service_pb2_grpc.AIServiceStub(self.channel)
             self._connected = True
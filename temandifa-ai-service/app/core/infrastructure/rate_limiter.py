@@ -1,15 +1,192 @@
 """
-Rate limiter configuration using SlowAPI.
+Token bucket rate limiter.
+
+Each client (API key, or remote address when no key is sent) owns a bucket of
+up to `rate_limit_burst` tokens that refills continuously at
+`rate_limit_requests / rate_limit_window`. Unlike a fixed window there is no
+reset boundary, so clients cannot fire two full quotas back-to-back around it.
+
+Buckets are stored in Redis and updated with a single atomic Lua call.
+Falls back to in-process buckets if Redis is not configured or unavailable.
 """
 
-from slowapi import Limiter
-from slowapi.util import get_remote_address
+import hashlib
+import math
+import time
+
+from fastapi import Depends, Request
 
 from app.core.config import settings
+from app.core.exceptions import RateLimitExceededException
+from app.core.infrastructure.cache import get_redis_client
+from app.core.logging import logger
+
+# KEYS[1]: bucket hash {tokens, ts}
+# ARGV: capacity, refill rate (tokens/s), now (s), cost
+# Returns: {allowed (0/1), retry_after (s, as string to keep precision)}
+TOKEN_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local cost = tonumber(ARGV[4])
+
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+
+local allowed = 0
+local retry_after = 0
+if tokens >= cost then
+    tokens = tokens - cost
+    allowed = 1
+else
+    retry_after = (cost - tokens) / rate
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / rate * 1000))
+return {allowed, tostring(retry_after)}
+"""
+
+WINDOW_UNITS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+
+# Upper bound on in-memory buckets before idle (full) ones are pruned
+MAX_LOCAL_BUCKETS = 10_000
+
+
+def parse_window_seconds(window: str) -> float:
+    """
+    Parse a rate limit window such as "1 minute", "30 seconds" or "hour".
+
+    Args:
+        window: Window string in "[amount] unit" format
+
+    Returns:
+        Window length in seconds
+    """
+    parts = window.strip().lower().split()
+    amount = float(parts[0]) if len(parts) > 1 else 1.0
+    unit = parts[-1].rstrip("s")
+
+    if unit not in WINDOW_UNITS:
+        raise ValueError(f"Unsupported rate limit window: {window!r}")
+
+    return amount * WINDOW_UNITS[unit]
+
+
+class TokenBucketLimiter:
+    """
+    Per-client token bucket backed by Redis with an in-memory fallback.
+
+    Usage:
+        limiter = TokenBucketLimiter(capacity=10, rate=10 / 60)
+        allowed, retry_after = limiter.acquire("client-key")
+    """
+
+    def __init__(self, capacity: float, rate: float, prefix: str = "ai:ratelimit"):
+        """
+        Initialize the limiter.
 
-# Initialize rate limiter with Redis storage
-# Falls back to memory if redis_url is not set (but it should be in docker-compose)
-limiter = Limiter(
-    key_func=get_remote_address,
-    storage_uri=settings.redis_url or "memory://",
+        Args:
+            capacity: Maximum tokens per bucket (burst size)
+            rate: Refill rate in tokens per second
+            prefix: Redis key prefix for buckets
+        """
+        self.capacity = capacity
+        self.rate = rate
+        self.prefix = prefix
+
+        self._script = None
+        self._local: dict[str, tuple[float, float]] = {}
+
+    def acquire(self, key: str, cost: float = 1.0) -> tuple[bool, float]:
+        """
+        Take `cost` tokens from the bucket identified by `key`.
+
+        Args:
+            key: Client identifier
+            cost: Tokens consumed by this request
+
+        Returns:
+            Tuple of (allowed, seconds until enough tokens are available)
+        """
+        client = get_redis_client()
+        if client is not None:
+            try:
+                return self._acquire_redis(client, key, cost)
+            except Exception as e:
+                logger.warning(
+                    "Rate limiter Redis error, using local bucket", error=str(e)
+                )
+
+        return self._acquire_local(key, cost)
+
+    def _acquire_redis(self, client, key: str, cost: float) -> tuple[bool, float]:
+        if self._script is None:
+            self._script = client.register_script(TOKEN_BUCKET_SCRIPT)
+
+        allowed, retry_after = self._script(
+            keys=[f"{self.prefix}:{key}"],
+            args=[self.capacity, self.rate, time.time(), cost],
+            client=client,
+        )
+        return bool(allowed), float(retry_after)
+
+    def _acquire_local(self, key: str, cost: float) -> tuple[bool, float]:
+        now = time.monotonic()
+        tokens, ts = self._local.get(key, (self.capacity, now))
+        tokens = min(self.capacity, tokens + (now - ts) * self.rate)
+
+        if tokens >= cost:
+            allowed, retry_after = True, 0.0
+            tokens -= cost
+        else:
+            allowed, retry_after = False, (cost - tokens) / self.rate
+
+        if key not in self._local and len(self._local) >= MAX_LOCAL_BUCKETS:
+            self._prune_local(now)
+        self._local[key] = (tokens, now)
+
+        return allowed, retry_after
+
+    def _prune_local(self, now: float):
+        """Drop buckets idle long enough to have refilled completely."""
+        refill_time = self.capacity / self.rate
+        self._local = {
+            k: (tokens, ts)
+            for k, (tokens, ts) in self._local.items()
+            if now - ts < refill_time
+        }
+
+
+def _client_key(request: Request) -> str:
+    """Bucket key: hashed API key if provided, otherwise the remote address."""
+    api_key = request.headers.get("X-API-Key")
+    if api_key:
+        return "key:" + hashlib.sha256(api_key.encode()).hexdigest()[:16]
+    return "ip:" + (request.client.host if request.client else "unknown")
+
+
+limiter = TokenBucketLimiter(
+    capacity=settings.rate_limit_burst,
+    rate=settings.rate_limit_requests
+    / parse_window_seconds(settings.rate_limit_window),
 )
+
+
+async def enforce_rate_limit(request: Request) -> None:
+    """
+    FastAPI dependency enforcing the token bucket for the calling client.
+
+    Raises:
+        RateLimitExceededException: If the client's bucket is empty
+    """
+    allowed, retry_after = limiter.acquire(_client_key(request))
+    if not allowed:
+        raise RateLimitExceededException(retry_after=math.ceil(retry_after))
+
+
+# Dependency for rate limited routes
+rate_limit = Depends(enforce_rate_limit)
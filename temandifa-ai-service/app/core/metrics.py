@@ -53,6 +53,12 @@ if PROMETHEUS_AVAILABLE and settings.enable_metrics:
     ACTIVE_REQUESTS = Gauge(
         "ai_service_active_requests", "Number of currently processing requests"
     )
+
+    GPU_FALLBACK_COUNT = Counter(
+        "ai_service_gpu_fallbacks_total",
+        "Inference requests retried on CPU after a GPU failure",
+        ["model"],
+    )
 else:
 
     class StubMetric:
@@ -77,6 +83,7 @@ else:
     DETECTION_COUNT = StubMetric()
     MEMORY_USAGE = StubMetric()
     ACTIVE_REQUESTS = StubMetric()
+    GPU_FALLBACK_COUNT = StubMetric()
 
 
 def get_metrics_text() -> str:
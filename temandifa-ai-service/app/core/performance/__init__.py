@@ -2,22 +2,12 @@
 
 from .batcher import BatcherRegistry, DynamicBatcher
 from .circuit_breaker import CircuitBreaker, CircuitBreakerOpenError
-from .memory_pool import (
-    MemoryPool,
-    audio_buffer,
-    get_all_pool_stats,
-    get_pool,
-    image_buffer,
-)
+from .executors import inference_executor
 
 __all__ = [
     "DynamicBatcher",
     "BatcherRegistry",
-    "MemoryPool",
-    "get_pool",
-    "image_buffer",
-    "audio_buffer",
-    "get_all_pool_stats",
     "CircuitBreaker",
     "CircuitBreakerOpenError",
+    "inference_executor",
 ]
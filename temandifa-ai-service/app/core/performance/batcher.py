@@ -4,7 +4,7 @@ Collects incoming requests and processes them in batches for efficient GPU utili
 """
 
 import asyncio
-from collections import deque
+import time
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from typing import Generic, TypeVar
@@ -21,9 +21,10 @@ class BatchItem(Generic[T, R]):
 
     data: T
     future: asyncio.Future = field(
-        default_factory=lambda: asyncio.get_event_loop().create_future()
+        default_factory=lambda: asyncio.get_running_loop().create_future()
     )
     request_id: str = "-"
+    enqueued_at: float = field(default_factory=time.monotonic)
 
 
 class DynamicBatcher(Generic[T, R]):
@@ -32,9 +33,11 @@ class DynamicBatcher(Generic[T, R]):
 
     Features:
     - Configurable max batch size
-    - Timeout-based batching (process after max_wait_ms even if batch not full)
-    - Async-safe with proper locking
-    - Error propagation to individual futures
+    - Dispatches as soon as a batch fills, or max_wait_ms after its first
+      item arrived if it does not
+    - Single consumer task draining an asyncio.Queue (no locks or timers)
+    - Error propagation to individual futures (process_fn may also return
+      an exception instance for a single item to fail only that item)
 
     Usage:
         batcher = DynamicBatcher(
@@ -66,9 +69,8 @@ class DynamicBatcher(Generic[T, R]):
         self.max_wait_ms = max_wait_ms
         self.name = name
 
-        self._queue: deque[BatchItem[T, R]] = deque()
-        self._lock = asyncio.Lock()
-        self._timer_task: asyncio.Task | None = None
+        self._queue: asyncio.Queue[BatchItem[T, R]] = asyncio.Queue()
+        self._worker_task: asyncio.Task | None = None
         self._is_processing = False
 
         logger.info(
@@ -90,45 +92,58 @@ class DynamicBatcher(Generic[T, R]):
             Processed result
         """
         item = BatchItem[T, R](data=data, request_id=request_id)
+        self._queue.put_nowait(item)
 
-        async with self._lock:
-            self._queue.append(item)
-            queue_size = len(self._queue)
-
-            # If batch is full, process immediately
-            if queue_size >= self.max_batch_size:
-                asyncio.create_task(self._process_batch())
-            # Otherwise, start timer if not already running
-            elif self._timer_task is None or self._timer_task.done():
-                self._timer_task = asyncio.create_task(self._wait_and_process())
+        # Start the consumer on first use (it must run on the serving loop)
+        if self._worker_task is None or self._worker_task.done():
+            self._worker_task = asyncio.create_task(self._run())
 
         logger.debug(
             "Item added to batch queue",
             name=self.name,
             request_id=request_id,
-            queue_size=queue_size,
+            queue_size=self._queue.qsize(),
         )
 
         return await item.future
 
-    async def _wait_and_process(self):
-        """Wait for timeout then process whatever is in the queue."""
-        await asyncio.sleep(self.max_wait_ms / 1000.0)
-        await self._process_batch()
-
-    async def _process_batch(self):
-        """Process all items currently in the queue."""
-        async with self._lock:
-            if not self._queue or self._is_processing:
-                return
+    async def _run(self):
+        """Consumer loop: collect a batch, process it, repeat."""
+        while True:
+            batch = await self._collect_batch()
+            await self._process_batch(batch)
 
-            self._is_processing = True
+    async def _collect_batch(self) -> list[BatchItem[T, R]]:
+        """
+        Wait for the next batch.
 
-            # Collect items up to max batch size
-            batch_size = min(len(self._queue), self.max_batch_size)
-            batch: list[BatchItem[T, R]] = [
-                self._queue.popleft() for _ in range(batch_size)
-            ]
+        Returns as soon as max_batch_size items are available, or once the
+        oldest item has waited max_wait_ms. Items that queued up while the
+        previous batch was running are drained without waiting.
+        """
+        batch = [await self._queue.get()]
+        deadline = batch[0].enqueued_at + self.max_wait_ms / 1000.0
+
+        while len(batch) < self.max_batch_size:
+            # Take everything already queued without yielding to the loop
+            while len(batch) < self.max_batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            if len(batch) >= self.max_batch_size:
+                break
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+
+        return batch
+
+    async def _process_batch(self, batch: list[BatchItem[T, R]]):
+        """Run process_fn on a batch and resolve each item's future."""
+        self._is_processing = True
 
         request_ids = [item.request_id for item in batch]
         logger.debug(
@@ -152,7 +167,11 @@ class DynamicBatcher(Generic[T, R]):
                 )
 
             for item, result in zip(batch, results):
-                if not item.future.done():
+                if item.future.done():
+                    continue
+                if isinstance(result, Exception):
+                    item.future.set_exception(result)
+                else:
                     item.future.set_result(result)
 
             logger.debug(
@@ -175,14 +194,10 @@ class DynamicBatcher(Generic[T, R]):
         finally:
             self._is_processing = False
 
-            # Check if more items arrived while processing
-            if self._queue:
-                asyncio.create_task(self._process_batch())
-
     @property
     def queue_size(self) -> int:
         """Current number of items waiting in queue."""
-        return len(self._queue)
+        return self._queue.qsize()
 
     @property
     def is_processing(self) -> bool:
@@ -4,7 +4,7 @@ Prevents cascading failures when external services are unavailable.
 """
 
 import time
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 
 from app.core import logger
 
@@ -119,6 +119,25 @@ class CircuitBreaker:
             self.record_failure()
             raise
 
+    async def execute_async(self, func: Callable[..., Awaitable], *args, **kwargs):
+        """Await coroutine function with circuit breaker protection."""
+        if not self.can_execute():
+            raise CircuitBreakerOpenError(
+                f"Circuit breaker '{self.name}' is open. "
+                "Service temporarily unavailable."
+            )
+
+        if self.state == self.STATE_HALF_OPEN:
+            self.half_open_calls += 1
+
+        try:
+            result = await func(*args, **kwargs)
+            self.record_success()
+            return result
+        except Exception:
+            self.record_failure()
+            raise
+
     def get_status(self) -> dict:
         """Get circuit breaker status for monitoring."""
         return {
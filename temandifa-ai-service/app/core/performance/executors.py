@@ -0,0 +1,16 @@
+"""
+Shared thread pool for blocking AI work.
+
+Model inference and image preprocessing from every service run on this one
+bounded pool instead of a pool per service, so the process never has more
+busy worker threads than AI_WORKER_THREADS.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from app.core.config import settings
+
+inference_executor = ThreadPoolExecutor(
+    max_workers=settings.ai_worker_threads,
+    thread_name_prefix="ai-worker",
+)
@@ -14,7 +14,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x10\x61i_service.proto\x12\taiservice\"4\n\x0cImageRequest\x12\x12\n\nimage_data\x18\x01 \x01(\x0c\x12\x10\n\x08\x66ilename\x18\x02 \x01(\t\"F\n\x0c\x41udioRequest\x12\x12\n\naudio_data\x18\x01 \x01(\x0c\x12\x10\n\x08\x66ilename\x18\x02 \x01(\t\x12\x10\n\x08language\x18\x03 \x01(\t\"D\n\nVQARequest\x12\x12\n\nimage_data\x18\x01 \x01(\x0c\x12\x10\n\x08\x66ilename\x18\x02 \x01(\t\x12\x10\n\x08question\x18\x03 \x01(\t\"?\n\x0bVQAResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x0e\n\x06\x61nswer\x18\x03 \x01(\t\"a\n\x11\x44\x65tectionResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12*\n\x07objects\x18\x03 \x03(\x0b\x32\x19.aiservice.DetectedObject\"A\n\x0e\x44\x65tectedObject\x12\r\n\x05label\x18\x01 \x01(\t\x12\x12\n\nconfidence\x18\x02 \x01(\x02\x12\x0c\n\x04\x62\x62ox\x18\x03 \x03(\x02\"D\n\nOCRRequest\x12\x12\n\nimage_data\x18\x01 \x01(\x0c\x12\x10\n\x08\x66ilename\x18\x02 \x01(\t\x12\x10\n\x08language\x18\x03 \x01(\t\"e\n\x0bOCRResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x11\n\tfull_text\x18\x03 \x01(\t\x12!\n\x05lines\x18\x04 \x03(\x0b\x32\x12.aiservice.OCRLine\"9\n\x07OCRLine\x12\x0c\n\x04text\x18\x01 \x01(\t\x12\x12\n\nconfidence\x18\x02 \x01(\x02\x12\x0c\n\x04\x62\x62ox\x18\x03 \x03(\x02\"Z\n\x15transcriptionResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0c\n\x04text\x18\x02 \x01(\t\x12\x10\n\x08language\x18\x03 \x01(\t\x12\x10\n\x08\x64uration\x18\x04 \x01(\x02\x32\xa9\x02\n\tAIService\x12\x46\n\rDetectObjects\x12\x17.aiservice.ImageRequest\x1a\x1c.aiservice.DetectionResponse\x12<\n\x0b\x45xtractText\x12\x15.aiservice.OCRRequest\x1a\x16.aiservice.OCRResponse\x12L\n\x0fTranscribeAudio\x12\x17.aiservice.AudioRequest\x1a .aiservice.transcriptionResponse\x12H\n\x17VisualQuestionAnswering\x12\x15.aiservice.VQARequest\x1a\x16.aiservice.VQAResponseB+Z)temandifa-backend/internal/grpc/aiserviceb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x10\x61i_service.proto\x12\taiservice\"L\n\x0cImageRequest\x12\x12\n\nimage_data\x18\x01 \x01(\x0c\x12\x10\n\x08\x66ilename\x18\x02 \x01(\t\x12\x16\n\x0eimage_shm_path\x18\x03 \x01(\t\"F\n\x0c\x41udioRequest\x12\x12\n\naudio_data\x18\x01 \x01(\x0c\x12\x10\n\x08\x66ilename\x18\x02 \x01(\t\x12\x10\n\x08language\x18\x03 \x01(\t\"\\\n\nVQARequest\x12\x12\n\nimage_data\x18\x01 \x01(\x0c\x12\x10\n\x08\x66ilename\x18\x02 \x01(\t\x12\x10\n\x08question\x18\x03 \x01(\t\x12\x16\n\x0eimage_shm_path\x18\x04 \x01(\t\"?\n\x0bVQAResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x0e\n\x06\x61nswer\x18\x03 \x01(\t\"a\n\x11\x44\x65tectionResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12*\n\x07objects\x18\x03 \x03(\x0b\x32\x19.aiservice.DetectedObject\"A\n\x0e\x44\x65tectedObject\x12\r\n\x05label\x18\x01 \x01(\t\x12\x12\n\nconfidence\x18\x02 \x01(\x02\x12\x0c\n\x04\x62\x62ox\x18\x03 \x03(\x02\"5\n\nImageBatch\x12\'\n\x06images\x18\x01 \x03(\x0b\x32\x17.aiservice.ImageRequest\"G\n\x16\x44\x65tectionBatchResponse\x12-\n\x07results\x18\x01 \x03(\x0b\x32\x1c.aiservice.DetectionResponse\"\\\n\nOCRRequest\x12\x12\n\nimage_data\x18\x01 \x01(\x0c\x12\x10\n\x08\x66ilename\x18\x02 \x01(\t\x12\x10\n\x08language\x18\x03 \x01(\t\x12\x16\n\x0eimage_shm_path\x18\x04 \x01(\t\"e\n\x0bOCRResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x11\n\tfull_text\x18\x03 \x01(\t\x12!\n\x05lines\x18\x04 \x03(\x0b\x32\x12.aiservice.OCRLine\"9\n\x07OCRLine\x12\x0c\n\x04text\x18\x01 \x01(\t\x12\x12\n\nconfidence\x18\x02 \x01(\x02\x12\x0c\n\x04\x62\x62ox\x18\x03 \x03(\x02\"Z\n\x15transcriptionResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0c\n\x04text\x18\x02 \x01(\t\x12\x10\n\x08language\x18\x03 \x01(\t\x12\x10\n\x08\x64uration\x18\x04 \x01(\x02\"R\n\x14TranscriptionSegment\x12\x0c\n\x04text\x18\x01 \x01(\t\x12\r\n\x05start\x18\x02 \x01(\x02\x12\x0b\n\x03\x65nd\x18\x03 \x01(\x02\x12\x10\n\x08language\x18\x04 \x01(\t2\x90\x04\n\tAIService\x12\x46\n\rDetectObjects\x12\x17.aiservice.ImageRequest\x1a\x1c.aiservice.DetectionResponse\x12N\n\x12\x44\x65tectObjectsBatch\x12\x15.aiservice.ImageBatch\x1a!.aiservice.DetectionBatchResponse\x12<\n\x0b\x45xtractText\x12\x15.aiservice.OCRRequest\x1a\x16.aiservice.OCRResponse\x12@\n\x11\x45xtractTextStream\x12\x15.aiservice.OCRRequest\x1a\x12.aiservice.OCRLine0\x01\x12L\n\x0fTranscribeAudio\x12\x17.aiservice.AudioRequest\x1a .aiservice.transcriptionResponse\x12S\n\x15TranscribeAudioStream\x12\x17.aiservice.AudioRequest\x1a\x1f.aiservice.TranscriptionSegment0\x01\x12H\n\x17VisualQuestionAnswering\x12\x15.aiservice.VQARequest\x1a\x16.aiservice.VQAResponseB+Z)temandifa-backend/internal/grpc/aiserviceb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -23,25 +23,31 @@ if _descriptor._USE_C_DESCRIPTORS == False:
   _globals['DESCRIPTOR']._options = None
   _globals['DESCRIPTOR']._serialized_options = b'Z)temandifa-backend/internal/grpc/aiservice'
   _globals['_IMAGEREQUEST']._serialized_start=31
-  _globals['_IMAGEREQUEST']._serialized_end=83
-  _globals['_AUDIOREQUEST']._serialized_start=85
-  _globals['_AUDIOREQUEST']._serialized_end=155
-  _globals['_VQAREQUEST']._serialized_start=157
-  _globals['_VQAREQUEST']._serialized_end=225
-  _globals['_VQARESPONSE']._serialized_start=227
-  _globals['_VQARESPONSE']._serialized_end=290
-  _globals['_DETECTIONRESPONSE']._serialized_start=292
-  _globals['_DETECTIONRESPONSE']._serialized_end=389
-  _globals['_DETECTEDOBJECT']._serialized_start=391
-  _globals['_DETECTEDOBJECT']._serialized_end=456
-  _globals['_OCRREQUEST']._serialized_start=458
-  _globals['_OCRREQUEST']._serialized_end=526
-  _globals['_OCRRESPONSE']._serialized_start=528
-  _globals['_OCRRESPONSE']._serialized_end=629
-  _globals['_OCRLINE']._serialized_start=631
-  _globals['_OCRLINE']._serialized_end=688
-  _globals['_TRANSCRIPTIONRESPONSE']._serialized_start=690
-  _globals['_TRANSCRIPTIONRESPONSE']._serialized_end=780
-  _globals['_AISERVICE']._serialized_start=783
-  _globals['_AISERVICE']._serialized_end=1080
+  _globals['_IMAGEREQUEST']._serialized_end=107
+  _globals['_AUDIOREQUEST']._serialized_start=109
+  _globals['_AUDIOREQUEST']._serialized_end=179
+  _globals['_VQAREQUEST']._serialized_start=181
+  _globals['_VQAREQUEST']._serialized_end=273
+  _globals['_VQARESPONSE']._serialized_start=275
+  _globals['_VQARESPONSE']._serialized_end=338
+  _globals['_DETECTIONRESPONSE']._serialized_start=340
+  _globals['_DETECTIONRESPONSE']._serialized_end=437
+  _globals['_DETECTEDOBJECT']._serialized_start=439
+  _globals['_DETECTEDOBJECT']._serialized_end=504
+  _globals['_IMAGEBATCH']._serialized_start=506
+  _globals['_IMAGEBATCH']._serialized_end=559
+  _globals['_DETECTIONBATCHRESPONSE']._serialized_start=561
+  _globals['_DETECTIONBATCHRESPONSE']._serialized_end=632
+  _globals['_OCRREQUEST']._serialized_start=634
+  _globals['_OCRREQUEST']._serialized_end=726
+  _globals['_OCRRESPONSE']._serialized_start=728
+  _globals['_OCRRESPONSE']._serialized_end=829
+  _globals['_OCRLINE']._serialized_start=831
+  _globals['_OCRLINE']._serialized_end=888
+  _globals['_TRANSCRIPTIONRESPONSE']._serialized_start=890
+  _globals['_TRANSCRIPTIONRESPONSE']._serialized_end=980
+  _globals['_TRANSCRIPTIONSEGMENT']._serialized_start=982
+  _globals['_TRANSCRIPTIONSEGMENT']._serialized_end=1064
+  _globals['_AISERVICE']._serialized_start=1067
+  _globals['_AISERVICE']._serialized_end=1595
 # @@protoc_insertion_point(module_scope)
@@ -19,16 +19,31 @@ class AIServiceStub(object):
                 request_serializer=ai__service__pb2.ImageRequest.SerializeToString,
                 response_deserializer=ai__service__pb2.DetectionResponse.FromString,
                 )
+        self.DetectObjectsBatch = channel.unary_unary(
+                '/aiservice.AIService/DetectObjectsBatch',
+                request_serializer=ai__service__pb2.ImageBatch.SerializeToString,
+                response_deserializer=ai__service__pb2.DetectionBatchResponse.FromString,
+                )
         self.ExtractText = channel.unary_unary(
                 '/aiservice.AIService/ExtractText',
                 request_serializer=ai__service__pb2.OCRRequest.SerializeToString,
                 response_deserializer=ai__service__pb2.OCRResponse.FromString,
                 )
+        self.ExtractTextStream = channel.unary_stream(
+                '/aiservice.AIService/ExtractTextStream',
+                request_serializer=ai__service__pb2.OCRRequest.SerializeToString,
+                response_deserializer=ai__service__pb2.OCRLine.FromString,
+                )
         self.TranscribeAudio = channel.unary_unary(
                 '/aiservice.AIService/TranscribeAudio',
                 request_serializer=ai__service__pb2.AudioRequest.SerializeToString,
                 response_deserializer=ai__service__pb2.transcriptionResponse.FromString,
                 )
+        self.TranscribeAudioStream = channel.unary_stream(
+                '/aiservice.AIService/TranscribeAudioStream',
+                request_serializer=ai__service__pb2.AudioRequest.SerializeToString,
+                response_deserializer=ai__service__pb2.TranscriptionSegment.FromString,
+                )
         self.VisualQuestionAnswering = channel.unary_unary(
                 '/aiservice.AIService/VisualQuestionAnswering',
                 request_serializer=ai__service__pb2.VQARequest.SerializeToString,
@@ -46,6 +61,13 @@ class AIServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def DetectObjectsBatch(self, request, context):
+        """Detects objects in several images with one call (batched on the model)
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def ExtractText(self, request, context):
         """Extracts text from an image (OCR)
         """
@@ -53,6 +75,13 @@ class AIServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def ExtractTextStream(self, request, context):
+        """Extracts text, streaming one message per line (no size limit on dense pages)
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def TranscribeAudio(self, request, context):
         """Transcribes audio to text
         """
@@ -60,6 +89,13 @@ class AIServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def TranscribeAudioStream(self, request, context):
+        """Transcribes audio, streaming segments as they are decoded
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def VisualQuestionAnswering(self, request, context):
         """Visual Question Answering (VQA)
         """
@@ -75,16 +111,31 @@ def add_AIServiceServicer_to_server(servicer, server):
                     request_deserializer=ai__service__pb2.ImageRequest.FromString,
                     response_serializer=ai__service__pb2.DetectionResponse.SerializeToString,
             ),
+            'DetectObjectsBatch': grpc.unary_unary_rpc_method_handler(
+                    servicer.DetectObjectsBatch,
+                    request_deserializer=ai__service__pb2.ImageBatch.FromString,
+                    response_serializer=ai__service__pb2.DetectionBatchResponse.SerializeToString,
+            ),
             'ExtractText': grpc.unary_unary_rpc_method_handler(
                     servicer.ExtractText,
                     request_deserializer=ai__service__pb2.OCRRequest.FromString,
                     response_serializer=ai__service__pb2.OCRResponse.SerializeToString,
             ),
+            'ExtractTextStream': grpc.unary_stream_rpc_method_handler(
+                    servicer.ExtractTextStream,
+                    request_deserializer=ai__service__pb2.OCRRequest.FromString,
+                    response_serializer=ai__service__pb2.OCRLine.SerializeToString,
+            ),
             'TranscribeAudio': grpc.unary_unary_rpc_method_handler(
                     servicer.TranscribeAudio,
                     request_deserializer=ai__service__pb2.AudioRequest.FromString,
                     response_serializer=ai__service__pb2.transcriptionResponse.SerializeToString,
             ),
+            'TranscribeAudioStream': grpc.unary_stream_rpc_method_handler(
+                    servicer.TranscribeAudioStream,
+                    request_deserializer=ai__service__pb2.AudioRequest.FromString,
+                    response_serializer=ai__service__pb2.TranscriptionSegment.SerializeToString,
+            ),
             'VisualQuestionAnswering': grpc.unary_unary_rpc_method_handler(
                     servicer.VisualQuestionAnswering,
                     request_deserializer=ai__service__pb2.VQARequest.FromString,
@@ -117,6 +168,23 @@ class AIService(object):
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
+    @staticmethod
+    def DetectObjectsBatch(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/aiservice.AIService/DetectObjectsBatch',
+            ai__service__pb2.ImageBatch.SerializeToString,
+            ai__service__pb2.DetectionBatchResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
     @staticmethod
     def ExtractText(request,
             target,
@@ -134,6 +202,23 @@ class AIService(object):
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
+    @staticmethod
+    def ExtractTextStream(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/aiservice.AIService/ExtractTextStream',
+            ai__service__pb2.OCRRequest.SerializeToString,
+            ai__service__pb2.OCRLine.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
     @staticmethod
     def TranscribeAudio(request,
             target,
@@ -151,6 +236,23 @@ class AIService(object):
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
+    @staticmethod
+    def TranscribeAudioStream(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/aiservice.AIService/TranscribeAudioStream',
+            ai__service__pb2.AudioRequest.SerializeToString,
+            ai__service__pb2.TranscriptionSegment.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
     @staticmethod
     def VisualQuestionAnswering(request,
             target,
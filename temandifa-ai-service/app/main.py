@@ -9,8 +9,6 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import Response
-from slowapi import _rate_limit_exceeded_handler
-from slowapi.errors import RateLimitExceeded
 
 from app.core.config import settings
 from app.core.exceptions import AIServiceException, ai_service_exception_handler
@@ -20,7 +18,6 @@ from app.core.http.middleware import (
     RequestIDMiddleware,
     TimeoutMiddleware,
 )
-from app.core.infrastructure.rate_limiter import limiter
 from app.core.logging import Logger, setup_logging
 from app.core.metrics import get_metrics_content_type, get_metrics_text
 from app.routers import batch, detection, ocr, transcription, vqa
@@ -40,7 +37,7 @@ async def lifespan(app: FastAPI):
     Lifespan event handler for starting services.
     Starts gRPC Server in a separate process for isolation.
     """
-    global models_ready, grpc_process
+    global models_ready, grpc_processes
     logger.info("Starting TemanDifa AI Service", version=settings.app_version)
 
     # We no longer load models here to save RAM (Process Isolation).
@@ -51,12 +48,18 @@ async def lifespan(app: FastAPI):
 
     from app.worker import run_server
 
-    logger.info("Starting gRPC Process...")
-    grpc_process = multiprocessing.Process(target=run_server, daemon=True)
-    grpc_process.start()
-
-    if grpc_process.is_alive():
-        logger.info(f"gRPC Process started (PID: {grpc_process.pid})")
+    # Several processes share port 50051 through SO_REUSEPORT
+    logger.info("Starting gRPC Process...", count=settings.grpc_server_processes)
+    grpc_processes = [
+        multiprocessing.Process(target=run_server, args=(index,), daemon=True)
+        for index in range(settings.grpc_server_processes)
+    ]
+    for grpc_process in grpc_processes:
+        grpc_process.start()
+
+    if _grpc_alive():
+        pids = [grpc_process.pid for grpc_process in grpc_processes]
+        logger.info(f"gRPC Process started (PID: {', '.join(map(str, pids))})")
         # Assume readiness for now
         models_ready["yolo"] = True
         models_ready["ocr"] = True
@@ -70,24 +73,28 @@ async def lifespan(app: FastAPI):
     # Cleanup on shutdown
     logger.info("Shutting down AI Service...")
 
-    if grpc_process.is_alive():
-        logger.info("Terminating gRPC Process...")
-        grpc_process.terminate()
+    logger.info("Terminating gRPC Process...")
+    for grpc_process in grpc_processes:
+        if grpc_process.is_alive():
+            grpc_process.terminate()
+    for grpc_process in grpc_processes:
         grpc_process.join(timeout=5)
-        logger.info("gRPC Process stopped")
+    logger.info("gRPC Process stopped")
 
 
 # Create FastAPI app
 app = FastAPI(title=settings.app_name, version=settings.app_version, lifespan=lifespan)
 
-# Global process reference
-grpc_process = None
+# Global process references
+grpc_processes: list = []
+
+
+def _grpc_alive() -> bool:
+    """Whether every gRPC worker process is running."""
+    return bool(grpc_processes) and all(p.is_alive() for p in grpc_processes)
 
-# Add rate limiter state
-app.state.limiter = limiter
 
 # Exception handlers
-app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 app.add_exception_handler(AIServiceException, ai_service_exception_handler)
 
 # Middleware (order matters - first added is last executed)
@@ -120,7 +127,7 @@ def read_root():
         "status": "online",
         "service": settings.app_name,
         "version": settings.app_version,
-        "grpc_active": grpc_process.is_alive() if grpc_process else False,
+        "grpc_active": _grpc_alive(),
     }
 
 
@@ -131,7 +138,7 @@ async def health_check(response: Response):
     Checks if gRPC process is running AND if gRPC server is responsive.
     Returns HTTP 503 if critical components are down to trigger Docker restart.
     """
-    is_process_alive = grpc_process.is_alive() if grpc_process else False
+    is_process_alive = _grpc_alive()
     is_grpc_responsive = False
 
     if is_process_alive:
@@ -190,6 +197,7 @@ def get_config():
         "rate_limit": (
             f"{settings.rate_limit_requests} per {settings.rate_limit_window}"
         ),
+        "rate_limit_burst": settings.rate_limit_burst,
     }
 
 
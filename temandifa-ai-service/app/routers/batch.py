@@ -15,15 +15,15 @@ from app.core import (
     validate_image_file,
     verify_api_key,
 )
-from app.core.infrastructure.rate_limiter import limiter
+from app.core.infrastructure.rate_limiter import rate_limit
 from app.core.metrics import track_request
 from app.routers.helpers import (
     create_detection_data,
     create_ocr_data,
     parse_detection_objects,
 )
-from app.schemas.detection import DetectionResponse
-from app.schemas.ocr import OCRResponse
+from app.schemas.detection import DetectionResponseSchema
+from app.schemas.ocr import OCRResponseSchema
 
 router = APIRouter(tags=["Batch Processing"])
 
@@ -33,7 +33,7 @@ class BatchDetectionResult(BaseModel):
 
     filename: str
     status: str
-    data: DetectionResponse | dict | None = None
+    data: DetectionResponseSchema | dict | None = None
     error: str | None = None
 
 
@@ -47,12 +47,12 @@ class BatchDetectionResponse(BaseModel):
     results: list[BatchDetectionResult]
 
 
-async def process_single_detection(
-    file: UploadFile, content: bytes, language: str
-) -> BatchDetectionResult:
+async def process_detection_batch(
+    files: list[UploadFile], contents: list[bytes], language: str
+) -> list[BatchDetectionResult]:
     """
-    Process a single detection request.
-    Designed for parallel execution.
+    Detect objects in validated files with a single DetectObjectsBatch call.
+    The worker runs them through the YOLO batcher together.
     """
     from app.core.infrastructure.grpc_client import ai_client
     from app.grpc_generated import ai_service_pb2
@@ -60,41 +60,59 @@ async def process_single_detection(
 
     try:
         stub = ai_client.get_stub()
-        grpc_request = ai_service_pb2.ImageRequest(
-            filename=file.filename or "unknown", image_data=content
+        grpc_request = ai_service_pb2.ImageBatch(
+            images=[
+                ai_service_pb2.ImageRequest(
+                    filename=file.filename or "unknown", image_data=content
+                )
+                for file, content in zip(files, contents)
+            ]
         )
-        response = await stub.DetectObjects(grpc_request)
-
-        if not response.success:
-            raise Exception(response.message)
+        response = await stub.DetectObjectsBatch(grpc_request)
+    except Exception as e:
+        logger.error("Batch detection failed", files=len(files), error=str(e))
+        return [
+            BatchDetectionResult(filename=file.filename, status="error", error=str(e))
+            for file in files
+        ]
+
+    results = []
+    for file, result in zip(files, response.results):
+        if not result.success:
+            logger.error(
+                "Batch detection failed", filename=file.filename, error=result.message
+            )
+            results.append(
+                BatchDetectionResult(
+                    filename=file.filename, status="error", error=result.message
+                )
+            )
+            continue
 
         # Use helper function to parse detection objects
-        detections = parse_detection_objects(response.objects)
+        detections = parse_detection_objects(result.objects)
 
         if language and language != "en":
             detections = translate_detections(detections, language)
 
-        # Use helper function to create DetectionData
-        detection_data = create_detection_data(detections, language)
-
-        return BatchDetectionResult(
-            filename=file.filename,
-            status="success",
-            data=DetectionResponse(
+        results.append(
+            BatchDetectionResult(
+                filename=file.filename,
                 status="success",
-                filename=file.filename or "unknown",
-                data=detection_data,
-            ),
-        )
-    except Exception as e:
-        logger.error("Batch detection failed", filename=file.filename, error=str(e))
-        return BatchDetectionResult(
-            filename=file.filename, status="error", error=str(e)
+                data=DetectionResponseSchema(
+                    status="success",
+                    filename=file.filename or "unknown",
+                    data=create_detection_data(detections, language),
+                ),
+            )
         )
 
+    return results
 
-@router.post("/detect/batch", response_model=BatchDetectionResponse)
-@limiter.limit(f"{settings.rate_limit_requests}/{settings.rate_limit_window}")
+
+@router.post(
+    "/detect/batch", response_model=BatchDetectionResponse, dependencies=[rate_limit]
+)
 @track_request("detect_batch")
 async def detect_batch(
     request: Request,
@@ -104,7 +122,8 @@ async def detect_batch(
 ):
     """
     Batch object detection for multiple images.
-    Uses parallel processing with asyncio.gather for improved performance.
+    Sends every valid image to the worker in one DetectObjectsBatch call,
+    which runs them through the model as a single batch.
 
     - Maximum files: configured in settings (default 10)
     - Returns individual results for each file
@@ -113,25 +132,31 @@ async def detect_batch(
         files = files[: settings.max_batch_size]
         logger.warning(f"Batch size limited to {settings.max_batch_size} files")
 
-    # Pre-validate and read all files
-    tasks = []
-    for file in files:
+    # Pre-validate and read all files; failures get their result immediately
+    results: list[BatchDetectionResult | None] = []
+    valid_indices: list[int] = []
+    valid_contents: list[bytes] = []
+    for index, file in enumerate(files):
         try:
             validate_file_size(file.size, settings.max_image_size)
             content = await file.read()
             validate_image_file(content, file.filename)
-            tasks.append(process_single_detection(file, content, language))
+            valid_indices.append(index)
+            valid_contents.append(content)
+            results.append(None)
         except Exception as e:
-            # Create failed result immediately for validation errors
-            async def make_error_detection(f=file, err=e):
-                return BatchDetectionResult(
-                    filename=f.filename, status="error", error=str(err)
+            results.append(
+                BatchDetectionResult(
+                    filename=file.filename, status="error", error=str(e)
                 )
+            )
 
-            tasks.append(make_error_detection())
-
-    # Execute all tasks in parallel
-    results = await asyncio.gather(*tasks, return_exceptions=False)
+    if valid_indices:
+        detected = await process_detection_batch(
+            [files[index] for index in valid_indices], valid_contents, language
+        )
+        for index, result in zip(valid_indices, detected):
+            results[index] = result
 
     successful = sum(1 for r in results if r.status == "success")
     failed = len(results) - successful
@@ -146,7 +171,7 @@ class BatchOCRResult(BaseModel):
 
     filename: str
     status: str
-    data: OCRResponse | dict | None = None
+    data: OCRResponseSchema | dict | None = None
     error: str | None = None
 
 
@@ -188,15 +213,14 @@ async def process_single_ocr(
         return BatchOCRResult(
             filename=file.filename,
             status="success",
-            data=OCRResponse(filename=file.filename or "unknown", data=ocr_data),
+            data=OCRResponseSchema(filename=file.filename or "unknown", data=ocr_data),
         )
     except Exception as e:
         logger.error("Batch OCR failed", filename=file.filename, error=str(e))
         return BatchOCRResult(filename=file.filename, status="error", error=str(e))
 
 
-@router.post("/ocr/batch", response_model=BatchOCRResponse)
-@limiter.limit(f"{settings.rate_limit_requests}/{settings.rate_limit_window}")
+@router.post("/ocr/batch", response_model=BatchOCRResponse, dependencies=[rate_limit])
 @track_request("ocr_batch")
 async def ocr_batch(
     request: Request,
@@ -3,6 +3,7 @@ Object Detection Router with rate limiting, caching, and async processing.
 """
 
 from fastapi import APIRouter, Depends, File, Form, Request, UploadFile
+from fastapi.responses import ORJSONResponse
 
 from app.core import (
     generate_cache_key,
@@ -16,18 +17,26 @@ from app.core.degradation import degradation, get_detection_fallback
 from app.core.exceptions import ModelNotReadyException
 from app.core.http.upload import read_and_validate_image
 from app.core.infrastructure.grpc_client import ai_client
-from app.core.infrastructure.rate_limiter import limiter
+from app.core.infrastructure.rate_limiter import rate_limit
 from app.core.metrics import track_request
 from app.grpc_generated import ai_service_pb2
-from app.routers.helpers import create_detection_data, parse_detection_objects
-from app.schemas.detection import DetectionResponse
+from app.routers.helpers import (
+    create_detection_data,
+    json_response,
+    parse_detection_objects,
+)
+from app.schemas.detection import DetectionResponse, DetectionResponseSchema
 from app.utils.translations import translate_detections
 
 router = APIRouter(prefix="/detect", tags=["Object Detection"])
 
 
-@router.post("/", response_model=DetectionResponse)
-@limiter.limit(f"{settings.rate_limit_requests}/{settings.rate_limit_window}")
+@router.post(
+    "/",
+    response_class=ORJSONResponse,
+    responses={200: {"model": DetectionResponseSchema}},
+    dependencies=[rate_limit],
+)
 @track_request("detect")
 async def detect_objects(
     request: Request,
@@ -52,15 +61,17 @@ async def detect_objects(
         if language and language != "en":
             detections = translate_detections(detections, language)
 
-        return DetectionResponse(
-            filename=file.filename or "unknown",
-            data=create_detection_data(detections, language or "en"),
+        return json_response(
+            DetectionResponse(
+                filename=file.filename or "unknown",
+                data=create_detection_data(detections, language or "en"),
+            )
         )
 
     # Check if service is unavailable and should use fallback
     if degradation.should_use_fallback("detection"):
         logger.warning("Detection service degraded, returning fallback")
-        return get_detection_fallback(file.filename or "unknown")
+        return json_response(get_detection_fallback(file.filename or "unknown"))
 
     logger.info(
         "Forwarding detection request to gRPC Worker",
@@ -90,9 +101,11 @@ async def detect_objects(
         # Record success
         degradation.record_success("detection")
 
-        return DetectionResponse(
-            filename=file.filename or "unknown",
-            data=create_detection_data(detections, language or "en"),
+        return json_response(
+            DetectionResponse(
+                filename=file.filename or "unknown",
+                data=create_detection_data(detections, language or "en"),
+            )
         )
 
     except Exception as e:
@@ -3,8 +3,46 @@ Shared helper functions for routers.
 Eliminates code duplication across detection, OCR, and batch routers.
 """
 
-from app.schemas.detection import Detection, DetectionData
-from app.schemas.ocr import OCRBoundingBox, OCRData, OCRLine
+from fastapi.responses import ORJSONResponse, Response
+from pydantic import BaseModel
+
+from app.schemas.detection import Detection, DetectionData, DetectionResponse
+from app.schemas.ocr import OCRBoundingBox, OCRData, OCRLine, OCRResponse
+from app.schemas.vqa import VQAResponse
+
+
+def json_response(
+    result: DetectionResponse | OCRResponse | VQAResponse,
+) -> ORJSONResponse:
+    """
+    Serialize a NamedTuple response without FastAPI's response_model pass.
+
+    Args:
+        result: Response tuple built from trusted service output
+
+    Returns:
+        ORJSONResponse with the response body
+    """
+    return ORJSONResponse(content=result.to_dict())
+
+
+def model_json_response(model: BaseModel) -> Response:
+    """
+    Serialize a Pydantic response with its compiled serializer.
+
+    Skips FastAPI's response_model pass, which re-validates the model and
+    walks it through jsonable_encoder on every request.
+
+    Args:
+        model: Response model instance
+
+    Returns:
+        JSON Response with the serialized model
+    """
+    return Response(
+        content=model.__pydantic_serializer__.to_json(model),
+        media_type="application/json",
+    )
 
 
 def parse_detection_objects(objects: list) -> list[dict]:
@@ -2,7 +2,10 @@
 OCR Router with rate limiting, caching, and async processing.
 """
 
+import grpc
+import orjson
 from fastapi import APIRouter, Depends, File, Form, Request, UploadFile
+from fastapi.responses import ORJSONResponse, StreamingResponse
 
 from app.core import (
     generate_cache_key,
@@ -16,17 +19,21 @@ from app.core.degradation import degradation, get_ocr_fallback
 from app.core.exceptions import ModelNotReadyException
 from app.core.http.upload import read_and_validate_image
 from app.core.infrastructure.grpc_client import ai_client
-from app.core.infrastructure.rate_limiter import limiter
+from app.core.infrastructure.rate_limiter import rate_limit
 from app.core.metrics import track_request
 from app.grpc_generated import ai_service_pb2
-from app.routers.helpers import create_ocr_data
-from app.schemas.ocr import OCRData, OCRResponse
+from app.routers.helpers import create_ocr_data, json_response, parse_ocr_lines
+from app.schemas.ocr import OCRData, OCRResponse, OCRResponseSchema
 
 router = APIRouter(prefix="/ocr", tags=["OCR"])
 
 
-@router.post("/", response_model=OCRResponse)
-@limiter.limit(f"{settings.rate_limit_requests}/{settings.rate_limit_window}")
+@router.post(
+    "/",
+    response_class=ORJSONResponse,
+    responses={200: {"model": OCRResponseSchema}},
+    dependencies=[rate_limit],
+)
 @track_request("ocr")
 async def extract_text(
     request: Request,
@@ -46,14 +53,16 @@ async def extract_text(
 
     if cached_result:
         logger.info("OCR cache hit", filename=file.filename)
-        return OCRResponse(
-            filename=file.filename or "unknown", data=OCRData(**cached_result)
+        return json_response(
+            OCRResponse(
+                filename=file.filename or "unknown", data=OCRData(**cached_result)
+            )
         )
 
     # Check if service is unavailable and should use fallback
     if degradation.should_use_fallback("ocr"):
         logger.warning("OCR service degraded, returning fallback")
-        return get_ocr_fallback(file.filename or "unknown")
+        return json_response(get_ocr_fallback(file.filename or "unknown"))
 
     logger.info(
         "Forwarding OCR request to gRPC Worker",
@@ -81,10 +90,61 @@ async def extract_text(
         # Record success
         degradation.record_success("ocr")
 
-        return OCRResponse(filename=file.filename or "unknown", data=ocr_data)
+        return json_response(
+            OCRResponse(filename=file.filename or "unknown", data=ocr_data)
+        )
 
     except Exception as e:
         # Record failure for graceful degradation
         degradation.record_failure("ocr")
         logger.error("OCR failed", error=str(e))
         raise ModelNotReadyException(f"OCR Worker Error: {str(e)}")
+
+
+@router.post("/stream", dependencies=[rate_limit])
+@track_request("ocr_stream")
+async def extract_text_stream(
+    request: Request,
+    file: UploadFile = File(...),
+    language: str = Form(default="en"),
+    _: bool = Depends(verify_api_key),
+):
+    """
+    Extract text, streaming recognized lines as newline-delimited JSON.
+
+    Each line is {"text", "confidence", "bbox"}, so dense documents never
+    build one large response. Streamed results are not cached.
+    """
+    contents = await read_and_validate_image(file)
+
+    if degradation.should_use_fallback("ocr"):
+        raise ModelNotReadyException("OCR service temporarily degraded")
+
+    logger.info(
+        "Forwarding streaming OCR request to gRPC Worker",
+        filename=file.filename,
+        size=len(contents),
+        language=language,
+    )
+
+    stub = ai_client.get_stub()
+    call = stub.ExtractTextStream(
+        ai_service_pb2.OCRRequest(
+            filename=file.filename or "unknown", image_data=contents, language=language
+        )
+    )
+
+    async def ndjson():
+        try:
+            async for line in call:
+                yield orjson.dumps(parse_ocr_lines([line])[0].model_dump()) + b"\n"
+            degradation.record_success("ocr")
+        except grpc.aio.AioRpcError as e:
+            # Headers are already sent, so report the failure in-band
+            degradation.record_failure("ocr")
+            logger.error("Streaming OCR failed", error=e.details())
+            yield orjson.dumps({"error": e.details()}) + b"\n"
+        finally:
+            call.cancel()
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
@@ -2,7 +2,10 @@
 Transcription Router with rate limiting, caching, and async processing.
 """
 
+import grpc
+import orjson
 from fastapi import APIRouter, Depends, File, Request, UploadFile
+from fastapi.responses import StreamingResponse
 
 from app.core import (
     generate_cache_key,
@@ -16,16 +19,20 @@ from app.core.degradation import degradation, get_transcription_fallback
 from app.core.exceptions import ModelNotReadyException
 from app.core.http.upload import read_and_validate_audio
 from app.core.infrastructure.grpc_client import ai_client
-from app.core.infrastructure.rate_limiter import limiter
+from app.core.infrastructure.rate_limiter import rate_limit
 from app.core.metrics import track_request
 from app.grpc_generated import ai_service_pb2
+from app.routers.helpers import model_json_response
 from app.schemas.transcription import TranscriptionData, TranscriptionResponse
 
 router = APIRouter(prefix="/transcribe", tags=["Transcription"])
 
 
-@router.post("/", response_model=TranscriptionResponse)
-@limiter.limit(f"{settings.rate_limit_requests}/{settings.rate_limit_window}")
+@router.post(
+    "/",
+    responses={200: {"model": TranscriptionResponse}},
+    dependencies=[rate_limit],
+)
 @track_request("transcribe")
 async def transcribe_audio(
     request: Request,
@@ -44,14 +51,16 @@ async def transcribe_audio(
 
     if cached_result:
         logger.info("Transcription cache hit", filename=filename)
-        return TranscriptionResponse(
-            filename=filename, data=TranscriptionData(**cached_result)
+        return model_json_response(
+            TranscriptionResponse(
+                filename=filename, data=TranscriptionData(**cached_result)
+            )
         )
 
     # Check if service is unavailable and should use fallback
     if degradation.should_use_fallback("transcription"):
         logger.warning("Transcription service degraded, returning fallback")
-        return get_transcription_fallback(filename)
+        return model_json_response(get_transcription_fallback(filename))
 
     logger.info(
         "Forwarding transcription request to gRPC Worker",
@@ -90,10 +99,64 @@ async def transcribe_audio(
         # Record success
         degradation.record_success("transcription")
 
-        return TranscriptionResponse(filename=filename, data=transcription_data)
+        return model_json_response(
+            TranscriptionResponse(filename=filename, data=transcription_data)
+        )
 
     except Exception as e:
         # Record failure for graceful degradation
         degradation.record_failure("transcription")
         logger.error("Transcription failed", error=str(e))
         raise ModelNotReadyException(f"Transcription Worker Error: {str(e)}")
+
+
+@router.post("/stream", dependencies=[rate_limit])
+@track_request("transcribe_stream")
+async def transcribe_audio_stream(
+    request: Request,
+    file: UploadFile = File(...),
+    _: bool = Depends(verify_api_key),
+):
+    """
+    Transcribe audio, streaming segments as newline-delimited JSON.
+
+    Each line is {"text", "t_start", "t_end", "language"} and is sent as soon
+    as Whisper decodes the segment. Streamed results are not cached.
+    """
+    contents, filename = await read_and_validate_audio(file)
+
+    if degradation.should_use_fallback("transcription"):
+        raise ModelNotReadyException("Transcription service temporarily degraded")
+
+    logger.info(
+        "Forwarding streaming transcription request to gRPC Worker",
+        filename=filename,
+        size=len(contents),
+    )
+
+    stub = ai_client.get_stub()
+    call = stub.TranscribeAudioStream(
+        ai_service_pb2.AudioRequest(filename=filename, audio_data=contents)
+    )
+
+    async def ndjson():
+        try:
+            async for segment in call:
+                yield orjson.dumps(
+                    {
+                        "text": segment.text,
+                        "t_start": segment.start,
+                        "t_end": segment.end,
+                        "language": segment.language,
+                    }
+                ) + b"\n"
+            degradation.record_success("transcription")
+        except grpc.aio.AioRpcError as e:
+            # Headers are already sent, so report the failure in-band
+            degradation.record_failure("transcription")
+            logger.error("Streaming transcription failed", error=e.details())
+            yield orjson.dumps({"error": e.details()}) + b"\n"
+        finally:
+            call.cancel()
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
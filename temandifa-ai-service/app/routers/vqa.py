@@ -5,9 +5,10 @@ Features: rate limiting, caching, and async processing.
 """
 
 from fastapi import APIRouter, Depends, File, Form, Request, UploadFile
+from fastapi.responses import ORJSONResponse
 
 from app.core import (
-    generate_cache_key,
+    cache_key_from_digest,
     get_cached,
     logger,
     set_cached,
@@ -16,18 +17,24 @@ from app.core import (
 )
 from app.core.degradation import degradation, get_vqa_fallback
 from app.core.exceptions import ModelNotReadyException
-from app.core.http.upload import read_and_validate_image
+from app.core.http.upload import read_image_with_digest
+from app.core.http.validation import validate_image_file
 from app.core.infrastructure.grpc_client import ai_client
-from app.core.infrastructure.rate_limiter import limiter
+from app.core.infrastructure.rate_limiter import rate_limit
 from app.core.metrics import track_request
 from app.grpc_generated import ai_service_pb2
-from app.schemas.vqa import VQAData, VQAResponse
+from app.routers.helpers import json_response
+from app.schemas.vqa import VQAData, VQAResponse, VQAResponseSchema
 
 router = APIRouter(prefix="/vqa", tags=["Visual Question Answering"])
 
 
-@router.post("/", response_model=VQAResponse)
-@limiter.limit(f"{settings.rate_limit_requests}/{settings.rate_limit_window}")
+@router.post(
+    "/",
+    response_class=ORJSONResponse,
+    responses={200: {"model": VQAResponseSchema}},
+    dependencies=[rate_limit],
+)
 @track_request("vqa")
 async def ask_question(
     request: Request,
@@ -40,24 +47,29 @@ async def ask_question(
 
     Uses Google Gemini 1.5 Flash for intelligent image understanding.
     """
-    # Validate and read file
-    contents = await read_and_validate_image(file)
+    # Read and hash file in one pass
+    contents, digest = await read_image_with_digest(file)
 
     # Check cache (include question in key)
-    cache_key = generate_cache_key(f"vqa:{question}", contents)
+    cache_key = cache_key_from_digest(f"vqa:{question}", digest)
     cached_result = get_cached(cache_key)
 
     if cached_result:
         logger.info("VQA cache hit", filename=file.filename)
-        return VQAResponse(
-            filename=file.filename or "unknown",
-            data=VQAData(**cached_result),
+        return json_response(
+            VQAResponse(
+                filename=file.filename or "unknown",
+                data=VQAData(**cached_result),
+            )
         )
 
+    # Validate only on a cache miss
+    validate_image_file(contents, file.filename or "unknown")
+
     # Check if service is unavailable and should use fallback
     if degradation.should_use_fallback("vqa"):
         logger.warning("VQA service degraded, returning fallback")
-        return get_vqa_fallback(file.filename or "unknown", question)
+        return json_response(get_vqa_fallback(file.filename or "unknown", question))
 
     logger.info(
         "Forwarding VQA request to gRPC Worker",
@@ -96,7 +108,9 @@ async def ask_question(
         # Record success
         degradation.record_success("vqa")
 
-        return VQAResponse(filename=file.filename or "unknown", data=vqa_data)
+        return json_response(
+            VQAResponse(filename=file.filename or "unknown", data=vqa_data)
+        )
 
     except Exception as e:
         # Record failure for graceful degradation
@@ -105,8 +119,12 @@ async def ask_question(
         raise ModelNotReadyException(f"VQA Worker Error: {str(e)}")
 
 
-@router.post("/ask", response_model=VQAResponse)
-@limiter.limit(f"{settings.rate_limit_requests}/{settings.rate_limit_window}")
+@router.post(
+    "/ask",
+    response_class=ORJSONResponse,
+    responses={200: {"model": VQAResponseSchema}},
+    dependencies=[rate_limit],
+)
 @track_request("vqa")
 async def ask_about_image(
     request: Request,
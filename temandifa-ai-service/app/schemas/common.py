@@ -1,9 +1,30 @@
-from pydantic import BaseModel, Field
+from typing import NamedTuple
+
+from pydantic import BaseModel, ConfigDict, Field
+
+# Shared config for response schemas. Instances are built once from trusted
+# service output and only serialized, so they are immutable and reject
+# unknown fields instead of carrying them around.
+SCHEMA_CONFIG = ConfigDict(frozen=True, extra="forbid", validate_assignment=False)
+
+
+def response_to_dict(response: NamedTuple) -> dict:
+    """
+    Serialize a NamedTuple endpoint response to its JSON body.
+
+    The /detect, /ocr and /vqa responses are NamedTuples built from trusted
+    service output and serialized with this directly, skipping Pydantic
+    validation; their *ResponseSchema models document the same shape in
+    OpenAPI.
+    """
+    return {**response._asdict(), "data": response.data.model_dump()}
 
 
 class ModelStatus(BaseModel):
     """Status of individual AI models."""
 
+    model_config = SCHEMA_CONFIG
+
     yolo: bool = False
     ocr: bool = False
     whisper: bool = False
@@ -13,6 +34,8 @@ class ModelStatus(BaseModel):
 class HealthResponse(BaseModel):
     """Response for /health endpoint."""
 
+    model_config = SCHEMA_CONFIG
+
     status: str = Field(..., description="'healthy' or 'degraded'")
     models: ModelStatus
     versions: dict[str, str]
@@ -1,9 +1,15 @@
+from typing import NamedTuple
+
 from pydantic import BaseModel, Field
 
+from app.schemas.common import SCHEMA_CONFIG, response_to_dict
+
 
 class Detection(BaseModel):
     """Single object detection result."""
 
+    model_config = SCHEMA_CONFIG
+
     label: str = Field(..., description="Object label (translated if requested)")
     label_original: str | None = Field(None, description="Original English label")
     confidence: float = Field(..., ge=0, le=1, description="Detection confidence 0-1")
@@ -13,15 +19,30 @@ class Detection(BaseModel):
 class DetectionData(BaseModel):
     """Detection result data wrapper for consistency with other schemas."""
 
+    model_config = SCHEMA_CONFIG
+
     language: str = Field("en", description="Language for labels")
     count: int = Field(..., description="Number of detected objects")
     detections: list[Detection] = Field(..., description="List of detected objects")
 
 
-class DetectionResponse(BaseModel):
-    """Response for /detect endpoint."""
+class DetectionResponseSchema(BaseModel):
+    """Response for /detect endpoint (OpenAPI documentation only)."""
+
+    model_config = SCHEMA_CONFIG
 
     status: str = "success"
     filename: str
     data: DetectionData
     is_fallback: bool = False
+
+
+class DetectionResponse(NamedTuple):
+    """Response for /detect endpoint (OpenAPI shape: DetectionResponseSchema)."""
+
+    filename: str
+    data: DetectionData
+    status: str = "success"
+    is_fallback: bool = False
+
+    to_dict = response_to_dict
@@ -1,9 +1,15 @@
+from typing import NamedTuple
+
 from pydantic import BaseModel, Field
 
+from app.schemas.common import SCHEMA_CONFIG, response_to_dict
+
 
 class OCRBoundingBox(BaseModel):
     """OCR text bounding box with 4 corner points."""
 
+    model_config = SCHEMA_CONFIG
+
     top_left: list[float]
     top_right: list[float]
     bottom_right: list[float]
@@ -38,6 +44,8 @@ class OCRBoundingBox(BaseModel):
 class OCRLine(BaseModel):
     """Single line of extracted text."""
 
+    model_config = SCHEMA_CONFIG
+
     text: str
     confidence: float = Field(..., ge=0, le=1)
     bbox: OCRBoundingBox
@@ -46,6 +54,8 @@ class OCRLine(BaseModel):
 class OCRData(BaseModel):
     """OCR extraction result data."""
 
+    model_config = SCHEMA_CONFIG
+
     full_text: str
     word_count: int
     line_count: int
@@ -53,10 +63,23 @@ class OCRData(BaseModel):
     lines: list[OCRLine]
 
 
-class OCRResponse(BaseModel):
-    """Response for /ocr endpoint."""
+class OCRResponseSchema(BaseModel):
+    """Response for /ocr endpoint (OpenAPI documentation only)."""
+
+    model_config = SCHEMA_CONFIG
 
     status: str = "success"
     filename: str
     data: OCRData
     is_fallback: bool = False
+
+
+class OCRResponse(NamedTuple):
+    """Response for /ocr endpoint (OpenAPI shape: OCRResponseSchema)."""
+
+    filename: str
+    data: OCRData
+    status: str = "success"
+    is_fallback: bool = False
+
+    to_dict = response_to_dict
@@ -1,9 +1,13 @@
 from pydantic import BaseModel, Field
 
+from app.schemas.common import SCHEMA_CONFIG
+
 
 class TranscriptionData(BaseModel):
     """Transcription result data."""
 
+    model_config = SCHEMA_CONFIG
+
     text: str = Field(..., description="Transcribed text")
     language: str = Field(..., description="Detected language")
     duration: float = Field(0.0, description="Audio duration in seconds")
@@ -12,6 +16,8 @@ class TranscriptionData(BaseModel):
 class TranscriptionResponse(BaseModel):
     """Response for /transcribe endpoint."""
 
+    model_config = SCHEMA_CONFIG
+
     status: str = "success"
     filename: str
     data: TranscriptionData
@@ -1,19 +1,38 @@
 """VQA (Visual Question Answering) Pydantic schemas."""
 
+from typing import NamedTuple
+
 from pydantic import BaseModel, Field
 
+from app.schemas.common import SCHEMA_CONFIG, response_to_dict
+
 
 class VQAData(BaseModel):
     """VQA response data."""
 
+    model_config = SCHEMA_CONFIG
+
     question: str = Field(..., description="The question asked")
     answer: str = Field(..., description="AI-generated answer")
 
 
-class VQAResponse(BaseModel):
-    """VQA API response."""
+class VQAResponseSchema(BaseModel):
+    """VQA API response (OpenAPI documentation only)."""
+
+    model_config = SCHEMA_CONFIG
 
     status: str = Field("success", description="Response status")
     filename: str = Field(..., description="Original filename")
     data: VQAData = Field(..., description="VQA result data")
     is_fallback: bool = Field(False, description="Whether this is a fallback response")
+
+
+class VQAResponse(NamedTuple):
+    """VQA API response (OpenAPI shape: VQAResponseSchema)."""
+
+    filename: str
+    data: VQAData
+    status: str = "success"
+    is_fallback: bool = False
+
+    to_dict = response_to_dict
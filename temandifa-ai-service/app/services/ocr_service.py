@@ -1,25 +1,22 @@
 """
 PaddleOCR Multi-language OCR Service.
 Supports English, Indonesian, and Chinese text extraction with async processing.
-Enhanced with memory pool integration.
 """
 
 import asyncio
 import logging
-from concurrent.futures import ThreadPoolExecutor
+import threading
 
+import numpy as np
 from paddleocr import PaddleOCR
 from tenacity import before_log, retry, stop_after_attempt, wait_exponential
 
 from app.core import logger
 from app.core.config import settings
-from app.core.metrics import track_inference
+from app.core.metrics import GPU_FALLBACK_COUNT, track_inference
+from app.core.performance.executors import inference_executor
 from app.utils.preprocessing import preprocess_image
 
-# Conditional import for memory pool
-if settings.memory_pool_enabled:
-    from app.core.performance.memory_pool import image_buffer
-
 
 class OCRService:
     """
@@ -37,12 +34,28 @@ class OCRService:
     def __init__(self):
         self.models: dict[str, PaddleOCR] = {}
         self.ocr: PaddleOCR | None = None
-        self.executor = ThreadPoolExecutor(max_workers=settings.ai_worker_threads)
+        # CPU twins of self.models, used when GPU inference runs out of memory
+        self.cpu_models: dict[str, PaddleOCR] = {}
+        # Guards self.models against duplicate loads from executor threads
+        self._models_lock = threading.Lock()
+        self.executor = inference_executor
 
     def load(self):
-        """Explicitly load the default model."""
+        """Explicitly load the default model, then every supported language."""
         self._load_default_model()
 
+        # Warm remaining languages now so no request pays the load cost
+        for paddle_lang in sorted(set(self.SUPPORTED_LANGS.values())):
+            self._get_model(paddle_lang)
+
+        # Pre-build the OOM fallback so recovery never constructs a model
+        if settings.use_gpu and settings.enable_smart_fallback:
+            for paddle_lang in sorted(set(self.SUPPORTED_LANGS.values())):
+                logger.info("Loading PaddleOCR CPU fallback", language=paddle_lang)
+                self.cpu_models[paddle_lang] = self._create_model(
+                    paddle_lang, use_gpu=False
+                )
+
     @retry(
         stop=stop_after_attempt(settings.warmup_max_retries),
         wait=wait_exponential(multiplier=1, min=1, max=10),
@@ -55,46 +68,44 @@ class OCRService:
                 "Loading PaddleOCR English model", use_onnx=settings.enable_onnx
             )
 
-            self.models["en"] = PaddleOCR(
-                use_angle_cls=True,
-                lang="en",
-                show_log=False,
-                use_gpu=settings.use_gpu,
-                enable_mkldnn=not settings.use_gpu,
-                use_onnx=settings.enable_onnx,
-            )
+            with self._models_lock:
+                self.models["en"] = self._create_model("en")
             self.ocr = self.models["en"]
             logger.info("PaddleOCR English model loaded successfully")
         except Exception as e:
             logger.error("Failed to load PaddleOCR model", error=str(e))
             raise
 
+    def _create_model(self, paddle_lang: str, use_gpu: bool | None = None) -> PaddleOCR:
+        """Construct a PaddleOCR instance for a paddle language code."""
+        if use_gpu is None:
+            use_gpu = settings.use_gpu
+
+        return PaddleOCR(
+            use_angle_cls=settings.ocr_use_angle_cls,
+            lang=paddle_lang,
+            show_log=False,
+            use_gpu=use_gpu,
+            enable_mkldnn=not use_gpu,
+            use_onnx=settings.enable_onnx,
+        )
+
     def _get_model(self, lang: str) -> PaddleOCR:
         """Get or create OCR model for specified language."""
         paddle_lang = self.SUPPORTED_LANGS.get(lang, "en")
 
-        if paddle_lang not in self.models:
-            logger.info("Loading PaddleOCR model", language=paddle_lang)
-            self.models[paddle_lang] = PaddleOCR(
-                use_angle_cls=True,
-                lang=paddle_lang,
-                show_log=False,
-                use_gpu=settings.use_gpu,
-                enable_mkldnn=not settings.use_gpu,
-                use_onnx=settings.enable_onnx,
-            )
-            logger.info("PaddleOCR model loaded", language=paddle_lang)
+        model = self.models.get(paddle_lang)
+        if model is not None:
+            return model
 
-        return self.models[paddle_lang]
+        with self._models_lock:
+            # Another thread may have loaded it while we waited
+            if paddle_lang not in self.models:
+                logger.info("Loading PaddleOCR model", language=paddle_lang)
+                self.models[paddle_lang] = self._create_model(paddle_lang)
+                logger.info("PaddleOCR model loaded", language=paddle_lang)
 
-    def _preprocess_image(self, image_bytes: bytes):
-        """Preprocess image with optional memory pool."""
-        if settings.memory_pool_enabled:
-            with image_buffer() as buffer:
-                buffer.write(image_bytes)
-                buffer.seek(0)
-                return preprocess_image(buffer.read())
-        return preprocess_image(image_bytes)
+            return self.models[paddle_lang]
 
     def extract_text(self, image_bytes: bytes, lang: str = "en") -> dict:
         """
@@ -107,11 +118,11 @@ class OCRService:
         Returns:
             Dictionary with full_text, lines with details, and word_count
         """
-        img_array = self._preprocess_image(image_bytes)
+        img_array = preprocess_image(image_bytes)
         ocr_model = self._get_model(lang)
 
         try:
-            result = ocr_model.ocr(img_array, cls=True)
+            result = ocr_model.ocr(img_array, cls=settings.ocr_use_angle_cls)
         except Exception as e:
             error_msg = str(e).lower()
             if (
@@ -122,16 +133,15 @@ class OCRService:
                 logger.warning(
                     "OCR GPU Out of Memory, falling back to CPU for this request"
                 )
+                GPU_FALLBACK_COUNT.labels(model="ocr").inc()
                 try:
-                    fallback_model = PaddleOCR(
-                        use_angle_cls=True,
-                        lang=self.SUPPORTED_LANGS.get(lang, "en"),
-                        show_log=False,
-                        use_gpu=False,
-                        enable_mkldnn=True,
-                        use_onnx=settings.enable_onnx,
+                    paddle_lang = self.SUPPORTED_LANGS.get(lang, "en")
+                    fallback_model = self.cpu_models.get(paddle_lang)
+                    if fallback_model is None:
+                        fallback_model = self._create_model(paddle_lang, use_gpu=False)
+                    result = fallback_model.ocr(
+                        img_array, cls=settings.ocr_use_angle_cls
                     )
-                    result = fallback_model.ocr(img_array, cls=True)
                 except Exception as fallback_err:
                     logger.error("OCR Fallback also failed", error=str(fallback_err))
                     raise e
@@ -140,23 +150,24 @@ class OCRService:
 
         extracted_texts = []
         if result and result[0]:
-            for line in result[0]:
-                box = line[0]
-                text = line[1][0]
-                confidence = float(line[1][1])
-
-                extracted_texts.append(
-                    {
-                        "text": text,
-                        "confidence": round(confidence, 4),
-                        "bbox": {
-                            "top_left": box[0],
-                            "top_right": box[1],
-                            "bottom_right": box[2],
-                            "bottom_left": box[3],
-                        },
-                    }
-                )
+            lines = result[0]
+
+            # Flatten every (4, 2) corner box to [x1, y1, ..., x4, y4] in one
+            # vectorized pass instead of converting points line by line
+            flat_boxes = (
+                np.asarray([line[0] for line in lines], dtype=np.float32)
+                .reshape(len(lines), 8)
+                .tolist()
+            )
+
+            extracted_texts = [
+                {
+                    "text": text,
+                    "confidence": round(float(confidence), 4),
+                    "bbox": bbox,
+                }
+                for (_, (text, confidence)), bbox in zip(lines, flat_boxes)
+            ]
 
         full_text = " ".join([item["text"] for item in extracted_texts])
         word_count = len(full_text.split()) if full_text else 0
@@ -174,7 +185,7 @@ class OCRService:
     @track_inference("ocr")
     async def extract_text_async(self, image_bytes: bytes, lang: str = "en") -> dict:
         """Extract text from an image (async, non-blocking)."""
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         return await loop.run_in_executor(
             self.executor, self.extract_text, image_bytes, lang
         )
@@ -184,6 +195,6 @@ class OCRService:
         return {
             "model_loaded": self.ocr is not None,
             "loaded_languages": list(self.models.keys()),
-            "memory_pool_enabled": settings.memory_pool_enabled,
+            "cpu_fallback_languages": list(self.cpu_models.keys()),
             "use_gpu": settings.use_gpu,
         }
@@ -1,25 +1,24 @@
 """
 OpenAI Whisper Audio Transcription Service.
 Supports multiple model sizes and async processing.
-Optimized using faster-whisper (CTranslate2) with memory pool integration.
+Optimized using faster-whisper (CTranslate2), decoding audio from memory.
 """
 
 import asyncio
+import io
 import logging
 import os
-import tempfile
-from concurrent.futures import ThreadPoolExecutor
+import shutil
+import threading
+from collections.abc import AsyncIterator
 
-from faster_whisper import WhisperModel
+from faster_whisper import WhisperModel, download_model
 from tenacity import before_log, retry, stop_after_attempt, wait_exponential
 
 from app.core import logger
 from app.core.config import settings
 from app.core.metrics import track_inference
-
-# Conditional import for memory pool
-if settings.memory_pool_enabled:
-    from app.core.performance.memory_pool import audio_buffer
+from app.core.performance.executors import inference_executor
 
 
 class TranscriptionService:
@@ -27,7 +26,7 @@ class TranscriptionService:
 
     def __init__(self):
         self.model = None
-        self.executor = ThreadPoolExecutor(max_workers=settings.ai_worker_threads)
+        self.executor = inference_executor
 
     def load(self):
         """Explicitly load the Whisper model."""
@@ -43,7 +42,13 @@ class TranscriptionService:
         """Load Whisper model with configured size and retry logic."""
         try:
             device = settings.resolved_whisper_device
-            compute_type = "int8" if device == "cpu" else "float16"
+            if device == "cpu":
+                compute_type = "int8"
+            elif settings.whisper_int8_gpu:
+                # Halves weight memory vs float16 with negligible accuracy loss
+                compute_type = "int8_float16"
+            else:
+                compute_type = "float16"
 
             logger.info(
                 "Loading faster-whisper model",
@@ -52,13 +57,14 @@ class TranscriptionService:
                 compute_type=compute_type,
             )
 
+            download_root = os.environ.get(
+                "XDG_CACHE_HOME", "/app/models/.cache/whisper"
+            )
             self.model = WhisperModel(
-                settings.whisper_model,
+                self._shm_model_path(download_root) or settings.whisper_model,
                 device=device,
                 compute_type=compute_type,
-                download_root=os.environ.get(
-                    "XDG_CACHE_HOME", "/app/models/.cache/whisper"
-                ),
+                download_root=download_root,
             )
             logger.info("faster-whisper model loaded successfully", device=device)
         except Exception as e:
@@ -66,19 +72,35 @@ class TranscriptionService:
             self.model = None
             raise
 
-    def _write_temp_file(self, audio_bytes: bytes, suffix: str) -> str:
-        """Write audio to temp file using memory pool if enabled."""
-        if settings.memory_pool_enabled:
-            with audio_buffer() as buffer:
-                buffer.write(audio_bytes)
-                buffer.seek(0)
-                data = buffer.read()
-        else:
-            data = audio_bytes
+    def _shm_model_path(self, download_root: str) -> str | None:
+        """
+        Stage the Whisper model in shared memory and return its directory.
+
+        CTranslate2 mmaps model.bin, so loading from tmpfs never touches the
+        disk. The copy outlives the worker process, so restarts within the
+        same container reuse it. Returns None to load from download_root.
+        """
+        if not settings.whisper_shm_dir:
+            return None
+
+        shm_path = os.path.join(settings.whisper_shm_dir, settings.whisper_model)
+        if os.path.exists(os.path.join(shm_path, "model.bin")):
+            return shm_path
 
-        with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as temp:
-            temp.write(data)
-            return temp.name
+        staging_path = f"{shm_path}.{os.getpid()}.tmp"
+        try:
+            source = download_model(settings.whisper_model, cache_dir=download_root)
+            # Copy under a temporary name so a partial copy is never loaded
+            shutil.copytree(source, staging_path)
+            os.replace(staging_path, shm_path)
+            logger.info("Whisper model staged in shared memory", path=shm_path)
+            return shm_path
+        except Exception as e:
+            shutil.rmtree(staging_path, ignore_errors=True)
+            logger.warning(
+                "Could not stage Whisper model in shared memory", error=str(e)
+            )
+            return None
 
     def transcribe_audio(self, audio_bytes: bytes, filename: str) -> dict:
         """
@@ -86,7 +108,7 @@ class TranscriptionService:
 
         Args:
             audio_bytes: Raw audio bytes
-            filename: Original filename (for extension detection)
+            filename: Original filename (for logging)
 
         Returns:
             Dictionary with text and detected language
@@ -94,17 +116,12 @@ class TranscriptionService:
         if self.model is None:
             raise RuntimeError("Whisper model not loaded")
 
-        suffix = os.path.splitext(filename)[1] if "." in filename else ".wav"
-        temp_path = None
-
         try:
-            temp_path = self._write_temp_file(audio_bytes, suffix)
-
-            logger.debug(
-                "Starting transcription", filename=filename, temp_path=temp_path
-            )
+            logger.debug("Starting transcription", filename=filename)
 
-            segments, info = self.model.transcribe(temp_path, beam_size=5)
+            # faster-whisper decodes file-like objects directly via PyAV;
+            # BytesIO is seekable, so every container probes as from disk
+            segments, info = self.model.transcribe(io.BytesIO(audio_bytes), beam_size=5)
 
             text_segments = [segment.text for segment in segments]
             full_text = " ".join(text_segments).strip()
@@ -126,29 +143,79 @@ class TranscriptionService:
             logger.error("Transcription failed", error=str(e))
             raise
 
-        finally:
-            if temp_path and os.path.exists(temp_path):
-                try:
-                    os.remove(temp_path)
-                    logger.debug("Cleaned up temp audio file", path=temp_path)
-                except OSError as e:
-                    logger.warning(
-                        "Failed to remove temp file", path=temp_path, error=str(e)
-                    )
-
     @track_inference("whisper")
     async def transcribe_audio_async(self, audio_bytes: bytes, filename: str) -> dict:
         """Transcribe audio to text (async, non-blocking)."""
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         return await loop.run_in_executor(
             self.executor, self.transcribe_audio, audio_bytes, filename
         )
 
+    async def transcribe_audio_stream(
+        self, audio_bytes: bytes, filename: str
+    ) -> AsyncIterator[dict]:
+        """
+        Transcribe audio, yielding segments as faster-whisper decodes them.
+
+        Decoding runs on the executor; each segment is handed back to the
+        event loop through a queue so callers can forward it immediately.
+
+        Args:
+            audio_bytes: Raw audio bytes
+            filename: Original filename (for logging)
+
+        Yields:
+            Dictionaries with text, start, end and detected language
+        """
+        if self.model is None:
+            raise RuntimeError("Whisper model not loaded")
+
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        stop = threading.Event()
+        done = object()
+
+        def produce():
+            try:
+                segments, info = self.model.transcribe(
+                    io.BytesIO(audio_bytes), beam_size=5
+                )
+
+                for segment in segments:
+                    if stop.is_set():
+                        break
+                    loop.call_soon_threadsafe(
+                        queue.put_nowait,
+                        {
+                            "text": segment.text.strip(),
+                            "start": segment.start,
+                            "end": segment.end,
+                            "language": info.language,
+                        },
+                    )
+            except Exception as e:
+                logger.error(
+                    "Streaming transcription failed", filename=filename, error=str(e)
+                )
+                loop.call_soon_threadsafe(queue.put_nowait, e)
+            finally:
+                loop.call_soon_threadsafe(queue.put_nowait, done)
+
+        loop.run_in_executor(self.executor, produce)
+
+        try:
+            while (item := await queue.get()) is not done:
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            # Stop decoding if the consumer went away early
+            stop.set()
+
     def get_status(self) -> dict:
         """Get service status for health checks."""
         return {
             "model_loaded": self.model is not None,
             "model_size": settings.whisper_model,
             "device": settings.resolved_whisper_device,
-            "memory_pool_enabled": settings.memory_pool_enabled,
         }
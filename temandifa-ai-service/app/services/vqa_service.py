@@ -1,12 +1,10 @@
 """
 VQA (Visual Question Answering) Service using Google Gemini.
-Enhanced with async support, retry logic, circuit breaker pattern, and memory pool.
+Enhanced with async support, retry logic, and circuit breaker pattern.
 """
 
-import asyncio
 import io
 import logging
-from concurrent.futures import ThreadPoolExecutor
 
 import google.generativeai as genai
 from PIL import Image
@@ -14,12 +12,12 @@ from tenacity import before_log, retry, stop_after_attempt, wait_exponential
 
 from app.core import logger
 from app.core.config import settings
+from app.core.http.validation import detect_file_type
 from app.core.metrics import track_inference
 from app.core.performance.circuit_breaker import CircuitBreaker, CircuitBreakerOpenError
 
-# Conditional import for memory pool
-if settings.memory_pool_enabled:
-    from app.core.performance.memory_pool import image_buffer
+# Image formats sent to Gemini as raw bytes without re-encoding
+GEMINI_IMAGE_TYPES = frozenset({"image/jpeg", "image/png", "image/webp"})
 
 # Global circuit breaker for Gemini API
 gemini_circuit_breaker = CircuitBreaker(
@@ -31,16 +29,15 @@ class VQAService:
     """
     Visual Question Answering Service using Google Gemini 1.5 Flash.
     Features:
-    - Async support with ThreadPoolExecutor
+    - Native async Gemini calls (no worker threads)
     - Retry logic with exponential backoff
     - Circuit breaker for rate limiting protection
-    - Memory pool integration
+    - Raw image bytes passed straight to Gemini
     """
 
     def __init__(self):
         self.model = None
         self.is_ready = False
-        self.executor = ThreadPoolExecutor(max_workers=settings.ai_worker_threads)
 
     def load(self):
         """Explicitly load/initialize the Gemini model."""
@@ -71,13 +68,17 @@ class VQAService:
             self.is_ready = False
             raise
 
-    def _load_image(self, image_data: bytes) -> Image.Image:
-        """Load image with optional memory pool."""
-        if settings.memory_pool_enabled:
-            with image_buffer() as buffer:
-                buffer.write(image_data)
-                buffer.seek(0)
-                return Image.open(io.BytesIO(buffer.read()))
+    def _image_part(self, image_data: bytes) -> dict | Image.Image:
+        """
+        Build the Gemini content part for an uploaded image.
+
+        Formats Gemini accepts natively are sent as raw bytes with their MIME
+        type, skipping a PIL decode and re-encode. Anything else (GIF, TIFF)
+        is opened with PIL so the SDK converts it.
+        """
+        mime_type = detect_file_type(image_data)
+        if mime_type in GEMINI_IMAGE_TYPES:
+            return {"mime_type": mime_type, "data": image_data}
         return Image.open(io.BytesIO(image_data))
 
     @retry(
@@ -86,19 +87,21 @@ class VQAService:
         before=before_log(logging.getLogger("temandifa-ai"), logging.WARNING),
         reraise=True,
     )
-    def _call_gemini_api(self, image: Image.Image, question: str) -> str:
-        """Call Gemini API with retry and circuit breaker."""
+    async def _call_gemini_api_async(
+        self, image: dict | Image.Image, question: str
+    ) -> str:
+        """Call Gemini API asynchronously with retry and circuit breaker."""
 
-        def _api_call():
-            response = self.model.generate_content([question, image])
+        async def _api_call():
+            response = await self.model.generate_content_async([question, image])
             return response.text
 
-        return gemini_circuit_breaker.execute(_api_call)
+        return await gemini_circuit_breaker.execute_async(_api_call)
 
     @track_inference("vqa")
-    def answer_question(self, image_data: bytes, question: str) -> str:
+    async def answer_question_async(self, image_data: bytes, question: str) -> str:
         """
-        Send image and question to Gemini API.
+        Send image and question to Gemini API without blocking the event loop.
 
         Args:
             image_data: Raw image bytes
@@ -111,8 +114,8 @@ class VQAService:
             raise ValueError("VQA service not initialized. Check GEMINI_API_KEY.")
 
         try:
-            image = self._load_image(image_data)
-            return self._call_gemini_api(image, question)
+            image = self._image_part(image_data)
+            return await self._call_gemini_api_async(image, question)
 
         except CircuitBreakerOpenError:
             logger.warning("VQA request rejected: Circuit breaker open")
@@ -124,18 +127,10 @@ class VQAService:
                 gemini_circuit_breaker.record_failure()
             raise
 
-    async def answer_question_async(self, image_data: bytes, question: str) -> str:
-        """Async version of answer_question."""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            self.executor, self.answer_question, image_data, question
-        )
-
     def get_status(self) -> dict:
         """Get service status for health checks."""
         return {
             "ready": self.is_ready,
             "api_key_configured": bool(settings.gemini_api_key),
             "circuit_breaker": gemini_circuit_breaker.get_status(),
-            "memory_pool_enabled": settings.memory_pool_enabled,
         }
@@ -1,13 +1,13 @@
 """
 YOLOv8 Object Detection Service.
 Supports GPU/CPU device selection and async inference.
-Optimized using ONNX Runtime with GPU batching and memory pooling.
+Optimized using ONNX Runtime with GPU batching and reusable input buffers.
 """
 
 import asyncio
 import logging
 import os
-from concurrent.futures import ThreadPoolExecutor
+import threading
 
 import numpy as np
 import onnxruntime as ort
@@ -16,14 +16,118 @@ from tenacity import before_log, retry, stop_after_attempt, wait_exponential
 from app.core import logger
 from app.core.config import settings
 from app.core.metrics import track_inference
-from app.utils.preprocessing import letterbox_image, nms, preprocess_image, xywh2xyxy
+from app.core.performance.executors import inference_executor
+from app.utils.preprocessing import (
+    LETTERBOX_BLOB_AVAILABLE,
+    decode_image_bgr,
+    letterbox_blob,
+    letterbox_blobs,
+    letterbox_image,
+    nms,
+    preprocess_image,
+    xywh2xyxy,
+)
 
 # Conditional imports for new features
 if settings.enable_batching:
     from app.core.performance.batcher import DynamicBatcher
 
-if settings.memory_pool_enabled:
-    from app.core.performance.memory_pool import image_buffer
+# COCO classes (80), indexed by model class id
+COCO_NAMES: tuple[str, ...] = (
+    "person",
+    "bicycle",
+    "car",
+    "motorcycle",
+    "airplane",
+    "bus",
+    "train",
+    "truck",
+    "boat",
+    "traffic light",
+    "fire hydrant",
+    "stop sign",
+    "parking meter",
+    "bench",
+    "bird",
+    "cat",
+    "dog",
+    "horse",
+    "sheep",
+    "cow",
+    "elephant",
+    "bear",
+    "zebra",
+    "giraffe",
+    "backpack",
+    "umbrella",
+    "handbag",
+    "tie",
+    "suitcase",
+    "frisbee",
+    "skis",
+    "snowboard",
+    "sports ball",
+    "kite",
+    "baseball bat",
+    "baseball glove",
+    "skateboard",
+    "surfboard",
+    "tennis racket",
+    "bottle",
+    "wine glass",
+    "cup",
+    "fork",
+    "knife",
+    "spoon",
+    "bowl",
+    "banana",
+    "apple",
+    "sandwich",
+    "orange",
+    "broccoli",
+    "carrot",
+    "hot dog",
+    "pizza",
+    "donut",
+    "cake",
+    "chair",
+    "couch",
+    "potted plant",
+    "bed",
+    "dining table",
+    "toilet",
+    "tv",
+    "laptop",
+    "mouse",
+    "remote",
+    "keyboard",
+    "cell phone",
+    "microwave",
+    "oven",
+    "toaster",
+    "sink",
+    "refrigerator",
+    "book",
+    "clock",
+    "vase",
+    "scissors",
+    "teddy bear",
+    "hair drier",
+    "toothbrush",
+)
+
+# Model input resolution (square)
+INPUT_SIZE = 640
+
+# Input tensor name of Ultralytics ONNX exports, used for TensorRT profiles
+INPUT_NAME = "images"
+
+# INT8 calibration table written by scripts/quantize_model.py --yolo-trt-calibration
+TRT_CALIBRATION_TABLE = "calibration.flatbuffers"
+
+# Per-class coordinate offset for class-aware NMS; larger than any box
+# coordinate, so boxes of different classes can never overlap
+NMS_CLASS_OFFSET = 7680
 
 
 class YoloService:
@@ -31,94 +135,17 @@ class YoloService:
 
     def __init__(self):
         self.session = None
-        self.executor = ThreadPoolExecutor(max_workers=settings.ai_worker_threads)
+        self.executor = inference_executor
         self.input_name = None
         self.output_names = None
+        self.input_dtype = np.float32
         self.batcher = None
 
-        # COCO Classes (80)
-        self.names = [
-            "person",
-            "bicycle",
-            "car",
-            "motorcycle",
-            "airplane",
-            "bus",
-            "train",
-            "truck",
-            "boat",
-            "traffic light",
-            "fire hydrant",
-            "stop sign",
-            "parking meter",
-            "bench",
-            "bird",
-            "cat",
-            "dog",
-            "horse",
-            "sheep",
-            "cow",
-            "elephant",
-            "bear",
-            "zebra",
-            "giraffe",
-            "backpack",
-            "umbrella",
-            "handbag",
-            "tie",
-            "suitcase",
-            "frisbee",
-            "skis",
-            "snowboard",
-            "sports ball",
-            "kite",
-            "baseball bat",
-            "baseball glove",
-            "skateboard",
-            "surfboard",
-            "tennis racket",
-            "bottle",
-            "wine glass",
-            "cup",
-            "fork",
-            "knife",
-            "spoon",
-            "bowl",
-            "banana",
-            "apple",
-            "sandwich",
-            "orange",
-            "broccoli",
-            "carrot",
-            "hot dog",
-            "pizza",
-            "donut",
-            "cake",
-            "chair",
-            "couch",
-            "potted plant",
-            "bed",
-            "dining table",
-            "toilet",
-            "tv",
-            "laptop",
-            "mouse",
-            "remote",
-            "keyboard",
-            "cell phone",
-            "microwave",
-            "oven",
-            "toaster",
-            "sink",
-            "refrigerator",
-            "book",
-            "clock",
-            "vase",
-            "scissors",
-            "teddy bear",
-            "hair drier",
-            "toothbrush",
-        ]
+        # IOBinding target device, resolved from the session providers
+        self.io_device = "cpu"
+        # Per-thread IOBinding and input buffers: executor threads run
+        # inference concurrently and a binding must not be shared
+        self._local = threading.local()
 
     def load(self):
         """Explicitly load the model."""
@@ -133,7 +160,7 @@ class YoloService:
         """Initialize dynamic batcher for GPU batch inference."""
 
         async def batch_process(images: list[bytes]) -> list[list[dict]]:
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             return await loop.run_in_executor(
                 self.executor,
                 self._batch_detect,
@@ -162,9 +189,21 @@ class YoloService:
         try:
             device = settings.resolved_yolo_device
             model_path = settings.yolo_model
-
-            # Use quantized model if enabled
-            if settings.enable_quantization:
+            use_tensorrt = settings.enable_tensorrt and device == "cuda"
+
+            # FP16 on CUDA halves transfer size and uses Tensor Cores;
+            # INT8 quantized model otherwise
+            if settings.enable_fp16 and device == "cuda":
+                if os.path.exists(settings.yolo_model_fp16):
+                    model_path = settings.yolo_model_fp16
+                    logger.info("Using FP16 model", path=model_path)
+                else:
+                    logger.warning(
+                        "FP16 model not found, using standard model",
+                        expected_path=settings.yolo_model_fp16,
+                    )
+            elif settings.enable_quantization and not use_tensorrt:
+                # TensorRT quantizes the FP32 model itself from calibration
                 quantized_path = settings.yolo_model_quantized
                 if os.path.exists(quantized_path):
                     model_path = quantized_path
@@ -185,19 +224,52 @@ class YoloService:
             # Configure providers
             providers = ["CPUExecutionProvider"]
             if device == "cuda":
-                providers = ["CUDAExecutionProvider", "CPUExecutionProvider"]
+                providers = [
+                    (
+                        "CUDAExecutionProvider",
+                        {
+                            # Skip exhaustive cuDNN benchmarking on first run
+                            "cudnn_conv_algo_search": "HEURISTIC",
+                            # Grow the memory arena only by what is requested
+                            "arena_extend_strategy": "kSameAsRequested",
+                        },
+                    ),
+                    "CPUExecutionProvider",
+                ]
             elif device == "mps":
                 providers = ["CPUExecutionProvider"]
 
-            self.session = ort.InferenceSession(model_path, providers=providers)
+            if use_tensorrt:
+                providers.insert(
+                    0, ("TensorrtExecutionProvider", self._tensorrt_options())
+                )
+
+            session_options, model_path = self._session_options(
+                model_path,
+                "tensorrt" if use_tensorrt else "cuda" if device == "cuda" else "cpu",
+            )
+            self.session = ort.InferenceSession(
+                model_path, sess_options=session_options, providers=providers
+            )
 
             self.input_name = self.session.get_inputs()[0].name
             self.output_names = [o.name for o in self.session.get_outputs()]
+            self.input_dtype = (
+                np.float16
+                if self.session.get_inputs()[0].type == "tensor(float16)"
+                else np.float32
+            )
+            self.io_device = (
+                "cuda"
+                if "CUDAExecutionProvider" in self.session.get_providers()
+                else "cpu"
+            )
 
             logger.info(
                 "YOLOv8 ONNX model loaded successfully",
                 providers=self.session.get_providers(),
                 quantized=settings.enable_quantization,
+                input_dtype=np.dtype(self.input_dtype).name,
             )
 
         except Exception as e:
@@ -205,31 +277,209 @@ class YoloService:
             self.session = None
             raise
 
-    def _preprocess_single(self, image_bytes: bytes) -> tuple:
-        """Preprocess a single image for inference."""
-        # Use memory pool if enabled
-        if settings.memory_pool_enabled:
-            with image_buffer() as buffer:
-                buffer.write(image_bytes)
-                buffer.seek(0)
-                img0 = preprocess_image(buffer.read())
+    def _tensorrt_options(self) -> dict:
+        """
+        TensorRT execution provider options.
+
+        The engine is built once for every batch size the batcher can form
+        and cached in trt_cache_dir, so later starts skip the slow build.
+        """
+        cache_dir = settings.trt_cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+
+        def shape(batch_size: int) -> str:
+            return f"{INPUT_NAME}:{batch_size}x3x{INPUT_SIZE}x{INPUT_SIZE}"
+
+        options = {
+            "trt_fp16_enable": True,
+            "trt_engine_cache_enable": True,
+            "trt_engine_cache_path": cache_dir,
+            "trt_max_workspace_size": 2 << 30,
+            "trt_profile_min_shapes": shape(1),
+            "trt_profile_opt_shapes": shape(settings.batch_max_size),
+            "trt_profile_max_shapes": shape(settings.batch_max_size),
+        }
+
+        if settings.enable_quantization:
+            if os.path.exists(os.path.join(cache_dir, TRT_CALIBRATION_TABLE)):
+                options["trt_int8_enable"] = True
+                options["trt_int8_calibration_table_name"] = TRT_CALIBRATION_TABLE
+            else:
+                logger.warning(
+                    "TensorRT INT8 calibration table not found, using FP16",
+                    expected_path=os.path.join(cache_dir, TRT_CALIBRATION_TABLE),
+                )
+
+        return options
+
+    def _session_options(
+        self, model_path: str, device: str
+    ) -> tuple[ort.SessionOptions, str]:
+        """
+        Build tuned session options for the YOLO model.
+
+        Args:
+            model_path: ONNX model to load
+            device: Execution device tag ("cpu", "cuda" or "tensorrt")
+
+        Returns:
+            Tuple of (session options, path to load). The path points at a
+            previously saved optimized graph when an up-to-date one exists.
+        """
+        so = ort.SessionOptions()
+        so.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        so.intra_op_num_threads = settings.ai_worker_threads
+        so.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+        # Idle intra-op threads sleep instead of spinning, leaving the CPU to
+        # preprocessing and the other services in this process
+        so.add_session_config_entry("session.intra_op.allow_spinning", "0")
+
+        # TensorRT subgraphs are compiled nodes that cannot be serialized;
+        # the engine cache covers them instead
+        if not settings.onnx_cache_optimized_model or device == "tensorrt":
+            return so, model_path
+
+        # Fused kernels are provider specific, so cache one graph per device
+        optimized_path = f"{os.path.splitext(model_path)[0]}.{device}.opt.onnx"
+        is_fresh = os.path.exists(optimized_path) and (
+            os.path.getmtime(optimized_path) >= os.path.getmtime(model_path)
+        )
+        if is_fresh:
+            logger.info("Using cached optimized YOLO graph", path=optimized_path)
+            so.graph_optimization_level = ort.GraphOptimizationLevel.ORT_DISABLE_ALL
+            return so, optimized_path
+
+        if os.access(os.path.dirname(optimized_path) or ".", os.W_OK):
+            so.optimized_model_filepath = optimized_path
+        return so, model_path
+
+    def _input_buffer(self, batch_size: int) -> np.ndarray:
+        """
+        Reusable per-thread input tensor for `batch_size` images.
+
+        Grows to the largest batch seen, so steady-state inference allocates
+        no new input arrays.
+        """
+        buffer = getattr(self._local, "input_buffer", None)
+        if buffer is None or buffer.shape[0] < batch_size:
+            buffer = np.empty(
+                (batch_size, 3, INPUT_SIZE, INPUT_SIZE), dtype=self.input_dtype
+            )
+            self._local.input_buffer = buffer
+        return buffer[:batch_size]
+
+    def _device_input(self, shape: tuple) -> ort.OrtValue:
+        """Per-thread device-resident input, reused while the batch shape holds."""
+        inputs = getattr(self._local, "device_inputs", None)
+        if inputs is None:
+            inputs = self._local.device_inputs = {}
+
+        value = inputs.get(shape)
+        if value is None:
+            value = ort.OrtValue.ortvalue_from_shape_and_type(
+                shape, self.input_dtype, self.io_device, 0
+            )
+            inputs[shape] = value
+        return value
+
+    def _run_inference(self, batch: np.ndarray) -> np.ndarray:
+        """
+        Run the session through a per-thread IOBinding.
+
+        Returns:
+            First model output, [N, 84, 8400]
+        """
+        binding = getattr(self._local, "io_binding", None)
+        if binding is None:
+            binding = self._local.io_binding = self.session.io_binding()
+
+        if self.io_device == "cpu":
+            # ORT reads the NumPy buffer in place
+            binding.bind_cpu_input(self.input_name, batch)
+        else:
+            # Copy into a persistent device tensor instead of a fresh one per run
+            device_input = self._device_input(batch.shape)
+            device_input.update_inplace(batch)
+            binding.bind_ortvalue_input(self.input_name, device_input)
+
+        for name in self.output_names:
+            binding.bind_output(name, self.io_device)
+
+        self.session.run_with_iobinding(binding)
+
+        # FP16 models return FP16; postprocessing works in FP32
+        return binding.copy_outputs_to_cpu()[0].astype(np.float32, copy=False)
+
+    def _preprocess_batch(self, images_bytes: list[bytes], out: np.ndarray) -> list:
+        """
+        Preprocess images into `out` ([N, 3, 640, 640] input tensor).
+
+        When every image decodes with OpenCV the whole batch is letterboxed,
+        normalized and packed into NCHW by a single blobFromImages call
+        (OpenCV builds with LETTERBOX_BLOB_AVAILABLE only).
+
+        Returns:
+            Per image: tuple of (original image, ratio, dw, dh)
+        """
+        # None marks images for the per-image fallback path: OpenCV cannot
+        # decode them, or this OpenCV build has no fused letterbox blob API
+        if LETTERBOX_BLOB_AVAILABLE:
+            decoded = [decode_image_bgr(image_bytes) for image_bytes in images_bytes]
         else:
-            img0 = preprocess_image(image_bytes)
+            decoded = [None] * len(images_bytes)
+
+        if all(img0 is not None for img0 in decoded):
+            geometry = letterbox_blobs(decoded, out, target_size=INPUT_SIZE)
+            return [
+                (img0, ratio, dw, dh)
+                for img0, (ratio, (dw, dh)) in zip(decoded, geometry)
+            ]
+
+        # Some images need the fallback decoder; preprocess one at a time
+        return [
+            self._preprocess_single(image_bytes, out[i], decoded[i])
+            for i, image_bytes in enumerate(images_bytes)
+        ]
+
+    def _preprocess_single(
+        self, image_bytes: bytes, out: np.ndarray, img0: np.ndarray | None
+    ) -> tuple:
+        """
+        Preprocess a single image into `out` ([3, 640, 640] slot of the input).
+
+        Args:
+            image_bytes: Raw image bytes
+            out: Destination slot, written in place
+            img0: Image already decoded by OpenCV, or None to use the fallback
+
+        Returns:
+            Tuple of (original image, ratio, dw, dh)
+        """
+        # Fused path: letterbox, BGR to RGB, HWC to CHW and /255 in one call
+        if img0 is not None and LETTERBOX_BLOB_AVAILABLE:
+            ratio, (dw, dh) = letterbox_blob(img0, out, target_size=INPUT_SIZE)
+            return img0, ratio, dw, dh
+
+        # Fallback when OpenCV is unavailable, too old for the fused path or
+        # cannot decode the image
+        img0 = preprocess_image(image_bytes)
 
         # Letterbox resizing (to 640x640 default)
-        img, ratio, (dw, dh) = letterbox_image(img0, target_size=640)
+        img, ratio, (dw, dh) = letterbox_image(img0, target_size=INPUT_SIZE)
 
-        # Normalize: HWC to CHW, divide by 255
-        img = img.transpose((2, 0, 1))  # HWC to CHW
-        img = np.ascontiguousarray(img)
-        img = img.astype(np.float32) / 255.0
+        # Normalize: HWC to CHW and divide by 255 in one pass straight into
+        # the input slot (the ufunc casts to FP16 when the model needs it)
+        np.divide(img.transpose((2, 0, 1)), np.float32(255), out=out, casting="unsafe")
 
-        return img, img0, ratio, dw, dh
+        return img0, ratio, dw, dh
 
-    def _batch_detect(self, images_bytes: list[bytes]) -> list[list[dict]]:
+    def _batch_detect(self, images_bytes: list[bytes]) -> list[list[dict] | Exception]:
         """
         Detect objects in a batch of images.
         This is more efficient on GPU than processing one at a time.
+
+        An image that cannot be preprocessed yields its exception in place of
+        detections, so one bad upload does not fail the rest of the batch.
         """
         if self.session is None:
             self.load()
@@ -238,17 +488,21 @@ class YoloService:
 
         batch_size = len(images_bytes)
 
-        # Preprocess all images
-        preprocessed = [self._preprocess_single(img) for img in images_bytes]
-        imgs = np.stack([p[0] for p in preprocessed], axis=0)  # [N, 3, 640, 640]
-        original_data = [(p[1], p[2], p[3], p[4]) for p in preprocessed]
+        # Preprocess all images straight into the reusable input tensor
+        imgs = self._input_buffer(batch_size)  # [N, 3, 640, 640]
+        try:
+            original_data = self._preprocess_batch(images_bytes, imgs)
+        except Exception:
+            if batch_size == 1:
+                raise
+            # Isolate the failing image(s) by detecting each one on its own
+            return [self._detect_or_error(image_bytes) for image_bytes in images_bytes]
 
         # Batch inference
-        results = self.session.run(self.output_names, {self.input_name: imgs})
+        output = self._run_inference(imgs)  # [N, 84, 8400]
 
         # Postprocess each image
         all_detections = []
-        output = results[0]  # [N, 84, 8400]
         output = output.transpose(0, 2, 1)  # [N, 8400, 84]
 
         for i in range(batch_size):
@@ -264,6 +518,12 @@ class YoloService:
 
         return all_detections
 
+    def _detect_or_error(self, image_bytes: bytes) -> list[dict] | Exception:
+        try:
+            return self.detect_objects(image_bytes)
+        except Exception as e:
+            return e
+
     def _postprocess(
         self,
         prediction: np.ndarray,
@@ -279,15 +539,13 @@ class YoloService:
         boxes = prediction[:, :4]  # [cx, cy, w, h]
         scores = prediction[:, 4:]  # [80 classes]
 
-        # Get max confidence score and class index for each anchor
-        class_ids = np.argmax(scores, axis=1)
-        confidences = np.max(scores, axis=1)
-
-        # Filter
-        mask = confidences > conf_thres
+        # Threshold on each anchor's best score first; most anchors fall
+        # below it, so argmax only has to scan the few surviving rows
+        max_scores = scores.max(axis=1)
+        mask = max_scores > conf_thres
         boxes = boxes[mask]
-        confidences = confidences[mask]
-        class_ids = class_ids[mask]
+        confidences = max_scores[mask]
+        class_ids = scores[mask].argmax(axis=1)
 
         if len(boxes) == 0:
             return []
@@ -295,40 +553,32 @@ class YoloService:
         # Convert cxcywh to xyxy
         boxes = xywh2xyxy(boxes)
 
-        # NMS
-        indices = nms(boxes, confidences, iou_threshold=0.45)
-
-        final_detections = []
-        for i in indices:
-            box = boxes[i].copy()
-            score = confidences[i]
-            cls_id = class_ids[i]
-
-            # Rescale boxes from 640x640 back to original image size
-            box[0] -= dw
-            box[1] -= dh
-            box[2] -= dw
-            box[3] -= dh
-            box /= ratio
-
-            # Clip to image bounds
-            h, w = img0.shape[:2]
-            box[0] = max(0, min(box[0], w))
-            box[1] = max(0, min(box[1], h))
-            box[2] = max(0, min(box[2], w))
-            box[3] = max(0, min(box[3], h))
-
-            label = self.names[cls_id] if cls_id < len(self.names) else str(cls_id)
-
-            final_detections.append(
-                {
-                    "label": label,
-                    "confidence": round(float(score), 4),
-                    "bbox": [round(float(b), 2) for b in box],
-                }
-            )
+        # Class-aware NMS in one call: shifting each class into its own
+        # coordinate range stops boxes suppressing other classes
+        offsets = class_ids[:, None].astype(np.float32) * NMS_CLASS_OFFSET
+        indices = nms(boxes + offsets, confidences, iou_threshold=0.45)
+
+        # Rescale kept boxes from 640x640 back to original image size
+        h, w = img0.shape[:2]
+        kept = boxes[indices]
+        kept -= np.array((dw, dh, dw, dh), dtype=kept.dtype)
+        kept /= ratio
+
+        # Clip to image bounds
+        np.clip(kept, 0, np.array((w, h, w, h), dtype=kept.dtype), out=kept)
+
+        # Round in float64 so tolist() yields clean Python floats
+        bboxes = np.round(kept.astype(np.float64), 2).tolist()
+        kept_confidences = np.round(confidences[indices].astype(np.float64), 4).tolist()
+        labels = [
+            COCO_NAMES[cls_id] if cls_id < len(COCO_NAMES) else str(cls_id)
+            for cls_id in class_ids[indices].tolist()
+        ]
 
-        return final_detections
+        return [
+            {"label": label, "confidence": confidence, "bbox": bbox}
+            for label, confidence, bbox in zip(labels, kept_confidences, bboxes)
+        ]
 
     def detect_objects(self, image_bytes: bytes) -> list[dict]:
         """
@@ -340,14 +590,13 @@ class YoloService:
                 raise RuntimeError("YOLOv8 model not loaded")
 
         # Preprocess
-        img, img0, ratio, dw, dh = self._preprocess_single(image_bytes)
-        img = np.expand_dims(img, axis=0)  # [1, 3, 640, 640]
+        img = self._input_buffer(1)  # [1, 3, 640, 640]
+        img0, ratio, dw, dh = self._preprocess_batch([image_bytes], img)[0]
 
         # Inference
-        results = self.session.run(self.output_names, {self.input_name: img})
+        output = self._run_inference(img)
 
         # Postprocess
-        output = results[0]
         output = output.transpose(0, 2, 1)  # [1, 8400, 84]
         prediction = output[0]  # [8400, 84]
 
@@ -367,7 +616,7 @@ class YoloService:
             return await self.batcher.add(image_bytes)
 
         # Fallback to single image processing
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         return await loop.run_in_executor(
             self.executor, self.detect_objects, image_bytes
         )
@@ -379,5 +628,4 @@ class YoloService:
             "batching_enabled": settings.enable_batching,
             "batcher_queue_size": self.batcher.queue_size if self.batcher else 0,
             "quantization_enabled": settings.enable_quantization,
-            "memory_pool_enabled": settings.memory_pool_enabled,
         }
@@ -5,6 +5,8 @@ Falls back to PIL if OpenCV is not available.
 """
 
 import io
+import threading
+from functools import lru_cache
 
 import numpy as np
 
@@ -20,6 +22,28 @@ except ImportError:
     logger.info("OpenCV not available, using PIL for image preprocessing")
 
 
+def _letterbox_blob_supported() -> bool:
+    """Whether OpenCV can letterbox into a blob (Image2BlobParams.borderValue)."""
+    if not OPENCV_AVAILABLE:
+        return False
+    dnn = getattr(cv2, "dnn", None)
+    return (
+        hasattr(dnn, "blobFromImagesWithParams")
+        and hasattr(dnn, "Image2BlobParams")
+        and hasattr(dnn.Image2BlobParams(), "borderValue")
+    )
+
+
+# letterbox_blob/letterbox_blobs need Image2BlobParams.borderValue, which
+# OpenCV 4.8 and older lack; those builds go through letterbox_image instead
+LETTERBOX_BLOB_AVAILABLE = _letterbox_blob_supported()
+if OPENCV_AVAILABLE and not LETTERBOX_BLOB_AVAILABLE:
+    logger.info(
+        "OpenCV lacks letterbox blob support, using letterbox_image",
+        opencv_version=cv2.__version__,
+    )
+
+
 def preprocess_image(content: bytes, max_dimension: int | None = None) -> np.ndarray:
     """
     Preprocess image to reduce memory usage and prepare for inference.
@@ -47,34 +71,12 @@ def preprocess_image(content: bytes, max_dimension: int | None = None) -> np.nda
 
 def _preprocess_opencv(content: bytes, max_dimension: int) -> np.ndarray:
     try:
-        nparr = np.frombuffer(content, np.uint8)
-        img = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
+        img = decode_image_bgr(content, max_dimension)
 
         if img is None:
             logger.warning("OpenCV failed to decode image, falling back to PIL")
             return _preprocess_pil(content, max_dimension)
 
-        height, width = img.shape[:2]
-        original_size = (width, height)
-
-        # Check if resize is needed
-        if max(width, height) > max_dimension:
-            if width > height:
-                new_width = max_dimension
-                new_height = int(height * (max_dimension / width))
-            else:
-                new_height = max_dimension
-                new_width = int(width * (max_dimension / height))
-
-            # Resize using INTER_AREA for downscaling (best quality)
-            img = cv2.resize(img, (new_width, new_height), interpolation=cv2.INTER_AREA)
-
-            logger.debug(
-                "Image resized (OpenCV)",
-                original=f"{original_size[0]}x{original_size[1]}",
-                new=f"{new_width}x{new_height}",
-            )
-
         # Convert BGR (OpenCV default) to RGB (Model expectation)
         img = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
         return img
@@ -84,6 +86,112 @@ def _preprocess_opencv(content: bytes, max_dimension: int) -> np.ndarray:
         return _preprocess_pil(content, max_dimension)
 
 
+def decode_image_bgr(
+    content: bytes, max_dimension: int | None = None
+) -> np.ndarray | None:
+    """
+    Decode and downscale an image with OpenCV, keeping OpenCV's BGR order.
+
+    Same resizing as preprocess_image, for callers that do their own
+    color conversion (e.g. letterbox_blob).
+
+    Args:
+        content: Raw image bytes
+        max_dimension: Max width/height (default from settings)
+
+    Returns:
+        BGR NumPy array, or None if OpenCV is unavailable or cannot decode
+    """
+    if not OPENCV_AVAILABLE:
+        return None
+
+    if max_dimension is None:
+        max_dimension = settings.max_image_dimension
+
+    # Large JPEGs decode at 1/2, 1/4 or 1/8 scale straight from the DCT
+    # coefficients, skipping most of the IDCT work and the full-size buffer
+    flags = cv2.IMREAD_COLOR
+    jpeg_size = _jpeg_size(content)
+    if jpeg_size is not None:
+        flags = _reduced_decode_flag(max(jpeg_size) / max_dimension)
+
+    nparr = np.frombuffer(content, np.uint8)
+    img = cv2.imdecode(nparr, flags)
+
+    if img is None:
+        return None
+
+    height, width = img.shape[:2]
+    original_size = (width, height)
+
+    # Check if resize is needed
+    if max(width, height) > max_dimension:
+        if width > height:
+            new_width = max_dimension
+            new_height = int(height * (max_dimension / width))
+        else:
+            new_height = max_dimension
+            new_width = int(width * (max_dimension / height))
+
+        # Resize using INTER_AREA for downscaling (best quality)
+        img = cv2.resize(img, (new_width, new_height), interpolation=cv2.INTER_AREA)
+
+        logger.debug(
+            "Image resized (OpenCV)",
+            original=f"{original_size[0]}x{original_size[1]}",
+            new=f"{new_width}x{new_height}",
+        )
+
+    return img
+
+
+def _jpeg_size(content: bytes) -> tuple[int, int] | None:
+    """
+    Read (width, height) from a JPEG's SOF header without decoding it.
+
+    Returns:
+        Stored image size, or None if content is not a parseable JPEG
+    """
+    if not content.startswith(b"\xff\xd8"):
+        return None
+
+    i = 2
+    while i + 9 < len(content):
+        if content[i] != 0xFF:
+            return None
+        marker = content[i + 1]
+
+        # Fill bytes and standalone markers carry no length field
+        if marker == 0xFF:
+            i += 1
+            continue
+        if marker == 0x01 or 0xD0 <= marker <= 0xD8:
+            i += 2
+            continue
+
+        # SOF0-SOF15, excluding DHT (C4), JPG (C8) and DAC (CC)
+        if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+            height = int.from_bytes(content[i + 5 : i + 7], "big")
+            width = int.from_bytes(content[i + 7 : i + 9], "big")
+            return width, height
+
+        i += 2 + int.from_bytes(content[i + 2 : i + 4], "big")
+
+    return None
+
+
+def _reduced_decode_flag(scale: float) -> int:
+    """Largest reduced-decode flag that keeps the image at or above target."""
+    for factor, flag in (
+        (8, cv2.IMREAD_REDUCED_COLOR_8),
+        (4, cv2.IMREAD_REDUCED_COLOR_4),
+        (2, cv2.IMREAD_REDUCED_COLOR_2),
+    ):
+        if scale >= factor:
+            return flag
+    return cv2.IMREAD_COLOR
+
+
 def _preprocess_pil(content: bytes, max_dimension: int) -> np.ndarray:
     """PIL-based preprocessing (fallback). Returns RGB array."""
     try:
@@ -113,12 +221,22 @@ def _preprocess_pil(content: bytes, max_dimension: int) -> np.ndarray:
 
 
 def letterbox_image(
-    image: np.ndarray, target_size: int = 640
+    image: np.ndarray, target_size: int = 640, canvas: np.ndarray | None = None
 ) -> tuple[np.ndarray, float, tuple[float, float]]:
     """
     Resize image to target_size maintaining aspect ratio using padding (Letterbox).
     Required for YOLO inference.
 
+    The resized image is written straight into a preallocated canvas and only
+    the border strips are refilled, so no per-call image arrays are allocated.
+
+    Args:
+        image: HWC image
+        target_size: Output width/height
+        canvas: Optional [target_size, target_size, C] array to draw into.
+            Defaults to a per-thread canvas that is reused across calls, so
+            the result is only valid until the next call on the same thread.
+
     Returns:
         padded_image: Resized and padded image
         ratio: Scale ratio (new / old)
@@ -131,41 +249,144 @@ def letterbox_image(
     r = min(new_shape / shape[0], new_shape / shape[1])
 
     # Compute padding
-    ratio = r, r  # width, height ratios
     new_unpad = int(round(shape[1] * r)), int(round(shape[0] * r))
     dw, dh = new_shape - new_unpad[0], new_shape - new_unpad[1]  # wh padding
 
     dw /= 2  # divide padding into 2 sides
     dh /= 2
 
-    if shape[::-1] != new_unpad:  # resize
-        if OPENCV_AVAILABLE:
-            image = cv2.resize(image, new_unpad, interpolation=cv2.INTER_LINEAR)
-        else:
-            # Fallback (assuming image passed here is numpy array from PIL)
-            import PIL.Image
+    top = int(round(dh - 0.1))
+    left = int(round(dw - 0.1))
+    new_w, new_h = new_unpad
 
-            pil_img = PIL.Image.fromarray(image)
-            pil_img = pil_img.resize(new_unpad, PIL.Image.BILINEAR)
-            image = np.array(pil_img)
+    if canvas is None:
+        canvas = _thread_canvas(target_size, image.shape[2], image.dtype)
 
-    top, bottom = int(round(dh - 0.1)), int(round(dh + 0.1))
-    left, right = int(round(dw - 0.1)), int(round(dw + 0.1))
+    # Refill only the border; the image region is overwritten below
+    canvas[:top] = 114
+    canvas[top + new_h :] = 114
+    canvas[top : top + new_h, :left] = 114
+    canvas[top : top + new_h, left + new_w :] = 114
+    region = canvas[top : top + new_h, left : left + new_w]
 
-    if OPENCV_AVAILABLE:
-        image = cv2.copyMakeBorder(
-            image, top, bottom, left, right, cv2.BORDER_CONSTANT, value=(114, 114, 114)
-        )  # add border
+    if shape[::-1] == new_unpad:
+        region[...] = image
+    elif OPENCV_AVAILABLE:
+        cv2.resize(image, new_unpad, dst=region, interpolation=cv2.INTER_LINEAR)
     else:
-        # Simple padding with numpy
-        image = np.pad(
-            image,
-            ((top, bottom), (left, right), (0, 0)),
-            mode="constant",
-            constant_values=114,
-        )
+        # Fallback (assuming image passed here is numpy array from PIL)
+        import PIL.Image
 
-    return image, r, (dw, dh)
+        pil_img = PIL.Image.fromarray(image)
+        region[...] = np.asarray(pil_img.resize(new_unpad, PIL.Image.BILINEAR))
+
+    return canvas, r, (dw, dh)
+
+
+# Per-thread letterbox canvases, keyed by (size, channels, dtype)
+_letterbox_canvases = threading.local()
+
+
+def _thread_canvas(size: int, channels: int, dtype: np.dtype) -> np.ndarray:
+    canvases = getattr(_letterbox_canvases, "by_key", None)
+    if canvases is None:
+        canvases = _letterbox_canvases.by_key = {}
+
+    key = (size, channels, np.dtype(dtype))
+    canvas = canvases.get(key)
+    if canvas is None:
+        canvas = canvases[key] = np.full((size, size, channels), 114, dtype=dtype)
+    return canvas
+
+
+# Per-thread FP32 scratch for letterbox_blobs when the target is not FP32
+_blob_scratch = threading.local()
+
+
+@lru_cache(maxsize=4)
+def _letterbox_blob_params(target_size: int) -> "cv2.dnn.Image2BlobParams":
+    params = cv2.dnn.Image2BlobParams()
+    params.scalefactor = (1 / 255.0,) * 3
+    params.size = (target_size, target_size)
+    params.swapRB = True
+    params.paddingmode = cv2.dnn.DNN_PMODE_LETTERBOX
+    params.borderValue = (114, 114, 114)
+    return params
+
+
+def letterbox_blob(
+    image: np.ndarray, out: np.ndarray, target_size: int = 640
+) -> tuple[float, tuple[float, float]]:
+    """
+    Letterbox a BGR image straight into a CHW float32 tensor.
+
+    Requires LETTERBOX_BLOB_AVAILABLE.
+
+    One OpenCV call does the resize, padding, BGR to RGB swap, HWC to CHW
+    transpose and 1/255 scaling that letterbox_image plus manual
+    normalization otherwise do in separate passes.
+
+    Args:
+        image: BGR uint8 image
+        out: [3, target_size, target_size] float32 or float16 array, written
+            in place
+        target_size: Model input size
+
+    Returns:
+        ratio: Scale ratio (new / old)
+        (dw, dh): Left and top padding
+    """
+    return letterbox_blobs([image], out[np.newaxis], target_size)[0]
+
+
+def letterbox_blobs(
+    images: list[np.ndarray], out: np.ndarray, target_size: int = 640
+) -> list[tuple[float, tuple[float, float]]]:
+    """
+    Letterbox a batch of BGR images into an NCHW tensor in one OpenCV call.
+
+    Images may differ in size; each is letterboxed on its own geometry.
+
+    Args:
+        images: BGR uint8 images
+        out: [N, 3, target_size, target_size] float32 or float16 array,
+            written in place
+        target_size: Model input size
+
+    Returns:
+        Per image: (ratio, (dw, dh)) as returned by letterbox_blob
+    """
+    geometry = []
+    for image in images:
+        height, width = image.shape[:2]
+        r = min(target_size / height, target_size / width)
+
+        # Same geometry OpenCV uses for DNN_PMODE_LETTERBOX
+        dw = (target_size - int(width * r)) // 2
+        dh = (target_size - int(height * r)) // 2
+        geometry.append((r, (float(dw), float(dh))))
+
+    # OpenCV blobs are FP32 only; other dtypes go through a reused FP32
+    # scratch and a single casting copy
+    target = out
+    if out.dtype != np.float32:
+        scratch = getattr(_blob_scratch, "buffer", None)
+        if (
+            scratch is None
+            or scratch.shape[0] < out.shape[0]
+            or scratch.shape[1:] != out.shape[1:]
+        ):
+            scratch = _blob_scratch.buffer = np.empty(out.shape, dtype=np.float32)
+        target = scratch[: out.shape[0]]
+
+    cv2.dnn.blobFromImagesWithParams(
+        images, target, _letterbox_blob_params(target_size)
+    )
+
+    if target is not out:
+        np.copyto(out, target, casting="same_kind")
+
+    return geometry
 
 
 def xywh2xyxy(x: np.ndarray) -> np.ndarray:
@@ -183,32 +404,59 @@ def nms(
 ) -> list[int]:
     """
     Non-Maximum Suppression (NMS) to remove overlapping bounding boxes.
-    Returns: List of indices to keep.
+    Uses OpenCV's C++ NMSBoxes when available, NumPy otherwise.
+
+    Args:
+        boxes: Nx4 boxes in [x1, y1, x2, y2] format
+        scores: N confidence scores (already threshold-filtered)
+        iou_threshold: Boxes overlapping a kept box above this IoU are dropped
+
+    Returns:
+        List of indices to keep, highest score first
     """
-    x1 = boxes[:, 0]
-    y1 = boxes[:, 1]
-    x2 = boxes[:, 2]
-    y2 = boxes[:, 3]
+    if OPENCV_AVAILABLE:
+        return _nms_opencv(boxes, scores, iou_threshold)
+    return _nms_numpy(boxes, scores, iou_threshold)
 
-    areas = (x2 - x1) * (y2 - y1)
-    order = scores.argsort()[::-1]
 
-    keep = []
-    while order.size > 0:
-        i = order[0]
-        keep.append(i)
+def _nms_opencv(
+    boxes: np.ndarray, scores: np.ndarray, iou_threshold: float
+) -> list[int]:
+    # NMSBoxes expects [x, y, w, h]
+    xywh = np.array(boxes[:, :4], dtype=np.float32)
+    xywh[:, 2:] -= xywh[:, :2]
 
-        xx1 = np.maximum(x1[i], x1[order[1:]])
-        yy1 = np.maximum(y1[i], y1[order[1:]])
-        xx2 = np.minimum(x2[i], x2[order[1:]])
-        yy2 = np.minimum(y2[i], y2[order[1:]])
+    # Scores are filtered by the caller, so keep everything above zero
+    indices = cv2.dnn.NMSBoxes(xywh, scores.astype(np.float32), 0.0, iou_threshold)
+    return np.asarray(indices, dtype=np.int64).reshape(-1).tolist()
 
-        w = np.maximum(0.0, xx2 - xx1)
-        h = np.maximum(0.0, yy2 - yy1)
-        inter = w * h
-        ovr = inter / (areas[i] + areas[order[1:]] - inter)
 
-        inds = np.where(ovr <= iou_threshold)[0]
-        order = order[inds + 1]
+def _nms_numpy(
+    boxes: np.ndarray, scores: np.ndarray, iou_threshold: float
+) -> list[int]:
+    """
+    Pure NumPy NMS fallback.
+
+    Boxes are sorted once by score; each kept box suppresses the lower scored
+    boxes after it through a boolean mask, so every pass works on contiguous
+    slices (views) instead of re-indexing the remaining order array.
+    """
+    order = np.argsort(-scores, kind="stable")
+    x1, y1, x2, y2 = np.ascontiguousarray(boxes[order, :4].T)
+    areas = (x2 - x1) * (y2 - y1)
+
+    n = len(order)
+    suppressed = np.zeros(n, dtype=bool)
+    keep = []
+    for i in range(n):
+        if suppressed[i]:
+            continue
+        keep.append(int(order[i]))
+
+        rest = slice(i + 1, n)
+        w = np.maximum(0.0, np.minimum(x2[i], x2[rest]) - np.maximum(x1[i], x1[rest]))
+        h = np.maximum(0.0, np.minimum(y2[i], y2[rest]) - np.maximum(y1[i], y1[rest]))
+        inter = w * h
+        suppressed[rest] |= inter / (areas[i] + areas[rest] - inter) > iou_threshold
 
     return keep
@@ -1,20 +1,14 @@
 """
 Async preprocessing utilities for image processing.
-Uses ThreadPoolExecutor to run CPU-bound preprocessing asynchronously.
+Runs CPU-bound preprocessing on the shared inference executor.
 """
 
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 
 from app.core import logger
 from app.core.config import settings
-
-# Shared executor for preprocessing tasks
-_preprocessing_executor = ThreadPoolExecutor(
-    max_workers=settings.ai_worker_threads,
-    thread_name_prefix="preprocessing",
-)
+from app.core.performance.executors import inference_executor
 
 
 async def preprocess_image_async(
@@ -38,11 +32,11 @@ async def preprocess_image_async(
     if quality is None:
         quality = settings.image_quality
 
-    loop = asyncio.get_event_loop()
+    loop = asyncio.get_running_loop()
 
     try:
         result = await loop.run_in_executor(
-            _preprocessing_executor,
+            inference_executor,
             partial(
                 _preprocess_image_sync,
                 image_bytes,
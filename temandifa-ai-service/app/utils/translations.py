@@ -1,6 +1,8 @@
 # YOLO Label Translations for Indonesian (Bahasa Indonesia)
 # Common object labels detected by YOLOv8
 
+from functools import lru_cache
+
 LABEL_TRANSLATIONS = {
     # People
     "person": "Orang",
@@ -111,7 +113,23 @@ def translate_label(label: str, lang: str = "id") -> str:
     if lang == "en":
         return label
 
-    # Convert to lowercase for matching
+    return _translate_to_indonesian(label)
+
+
+def _translate_to_indonesian(label: str) -> str:
+    # YOLO emits the table's keys verbatim, so the common case is a single
+    # dict lookup (cheaper than an lru_cache hit); only other spellings go
+    # through the memoized normalization below
+    translation = LABEL_TRANSLATIONS.get(label)
+    if translation is not None:
+        return translation
+
+    return _translate_normalized(label)
+
+
+@lru_cache(maxsize=256)
+def _translate_normalized(label: str) -> str:
+    # Cached so repeated off-table labels skip lower()/strip()/capitalize()
     label_lower = label.lower().strip()
 
     # Return translation if available, otherwise return capitalized original
@@ -127,11 +145,16 @@ def translate_detections(detections: list, lang: str = "id") -> list:
         lang: Target language code
 
     Returns:
-        List of detections with translated labels (adds 'label_translated' key)
+        List of detections with translated labels (original kept in
+        'label_original')
     """
+    if lang == "en":
+        return detections
+
     for detection in detections:
-        if "label" in detection:
-            detection["label_original"] = detection["label"]
-            detection["label"] = translate_label(detection["label"], lang)
+        label = detection.get("label")
+        if label is not None:
+            detection["label_original"] = label
+            detection["label"] = _translate_to_indonesian(label)
 
     return detections
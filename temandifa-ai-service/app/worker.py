@@ -5,20 +5,48 @@ Enhanced with graceful shutdown, request ID tracing, and health status reporting
 """
 
 import asyncio
-import glob
+import contextlib
 import os
 import signal
+import stat
 import tempfile
 
 import grpc
+from google.protobuf.internal import api_implementation
 
 from app.core import logger
+from app.core.config import settings
 from app.grpc_generated import ai_service_pb2, ai_service_pb2_grpc
 from app.services.ocr_service import OCRService
 from app.services.transcription_service import TranscriptionService
 from app.services.vqa_service import VQAService
 from app.services.yolo_service import YoloService
 
+try:
+    import uvloop
+
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+# gRPC server options, mirroring GRPC_CHANNEL_OPTIONS on the client side
+GRPC_SERVER_OPTIONS = [
+    # Several worker processes may share the port (GRPC_SERVER_PROCESSES)
+    ("grpc.so_reuseport", 1),
+    # Message size limits - same as the client, for batches of large images
+    ("grpc.max_receive_message_length", settings.grpc_max_message_size),
+    ("grpc.max_send_message_length", settings.grpc_max_message_size),
+    # Keepalive - accept the client's pings even between calls
+    ("grpc.keepalive_time_ms", settings.grpc_keepalive_time_ms),
+    ("grpc.keepalive_timeout_ms", settings.grpc_keepalive_timeout_ms),
+    ("grpc.keepalive_permit_without_calls", True),
+    ("grpc.http2.min_ping_interval_without_data_ms", 10000),
+    # Coalesce streamed messages into fewer, larger writes
+    ("grpc.http2.write_buffer_size", 1 << 20),  # 1MB
+    ("grpc.http2.max_frame_size", 1 << 20),  # 1MB
+    ("grpc.optimization_target", "throughput"),
+]
+
 # Global state for graceful shutdown
 _shutdown_event = asyncio.Event()
 _server = None
@@ -32,6 +60,32 @@ model_status = {
 }
 
 
+def _read_shm_image(path: str) -> bytes:
+    """
+    Read an image file from shared memory, enforcing max_image_size.
+
+    Args:
+        path: Resolved path inside grpc_shm_dir
+
+    Returns:
+        File contents
+    """
+    # O_NONBLOCK so a FIFO planted in the directory cannot hang the open
+    fd = os.open(path, os.O_RDONLY | os.O_NONBLOCK)
+    try:
+        st = os.fstat(fd)
+        if not stat.S_ISREG(st.st_mode):
+            raise ValueError("image_shm_path must be a regular file")
+        if st.st_size > settings.max_image_size:
+            raise ValueError(f"image_shm_path exceeds {settings.max_image_size} bytes")
+    except BaseException:
+        os.close(fd)
+        raise
+
+    with open(fd, "rb") as f:
+        return f.read(settings.max_image_size)
+
+
 class AIService(ai_service_pb2_grpc.AIServiceServicer):
     """
     gRPC Implementation of AI Service.
@@ -53,25 +107,77 @@ class AIService(ai_service_pb2_grpc.AIServiceServicer):
 
     def _get_request_id(self, context: grpc.aio.ServicerContext) -> str:
         """Extract request ID from gRPC metadata for tracing."""
-        metadata = dict(context.invocation_metadata())
-        return metadata.get("x-request-id", "-")
+        # Scan the few metadata pairs directly instead of building a dict
+        for key, value in context.invocation_metadata():
+            if key == "x-request-id":
+                return value
+        return "-"
+
+    @staticmethod
+    async def _image_data(request) -> bytes:
+        """
+        Image bytes of a request, read from image_shm_path when it is set.
+
+        Same-host clients can drop large images in shared memory instead of
+        copying them through protobuf and the socket. Paths outside
+        grpc_shm_dir, or inside whisper_shm_dir, are rejected so callers
+        cannot read arbitrary files.
+        """
+        if not request.image_shm_path:
+            return request.image_data
+
+        shm_dir = os.path.realpath(settings.grpc_shm_dir)
+        path = os.path.realpath(request.image_shm_path)
+        if os.path.commonpath([path, shm_dir]) != shm_dir:
+            raise ValueError(f"image_shm_path must be inside {settings.grpc_shm_dir}")
+        if settings.whisper_shm_dir:
+            whisper_dir = os.path.realpath(settings.whisper_shm_dir)
+            if os.path.commonpath([path, whisper_dir]) == whisper_dir:
+                raise ValueError("image_shm_path must not point at the Whisper model")
+
+        # Keep file I/O off the event loop
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, _read_shm_image, path)
 
     async def DetectObjects(
         self, request: ai_service_pb2.ImageRequest, context: grpc.aio.ServicerContext
     ) -> ai_service_pb2.DetectionResponse:
         request_id = self._get_request_id(context)
+        return await self._detect(request, request_id)
+
+    async def DetectObjectsBatch(
+        self, request: ai_service_pb2.ImageBatch, context: grpc.aio.ServicerContext
+    ) -> ai_service_pb2.DetectionBatchResponse:
+        request_id = self._get_request_id(context)
+
+        # Submitted together so the YOLO batcher packs them into one run
+        results = await asyncio.gather(
+            *(self._detect(image, request_id) for image in request.images)
+        )
+
+        logger.debug(
+            "Batch detection completed", request_id=request_id, images=len(results)
+        )
+
+        return ai_service_pb2.DetectionBatchResponse(results=results)
+
+    async def _detect(
+        self, image: ai_service_pb2.ImageRequest, request_id: str
+    ) -> ai_service_pb2.DetectionResponse:
+        """Run detection on one image; failures become an unsuccessful reply."""
         try:
-            results = await self.yolo_service.detect_objects_async(request.image_data)
-
-            objects = []
-            for res in results:
-                objects.append(
-                    ai_service_pb2.DetectedObject(
-                        label=res["label"],
-                        confidence=res["confidence"],
-                        bbox=res["bbox"],
-                    )
+            results = await self.yolo_service.detect_objects_async(
+                await self._image_data(image)
+            )
+
+            objects = [
+                ai_service_pb2.DetectedObject(
+                    label=res["label"],
+                    confidence=res["confidence"],
+                    bbox=res["bbox"],
                 )
+                for res in results
+            ]
 
             logger.debug(
                 "Detection completed", request_id=request_id, count=len(objects)
@@ -91,25 +197,19 @@ class AIService(ai_service_pb2_grpc.AIServiceServicer):
         try:
             lang = request.language if request.language else "en"
 
-            result = await self.ocr_service.extract_text_async(request.image_data, lang)
-
-            lines = []
-            if "lines" in result:
-                for line in result["lines"]:
-                    bbox_flat = []
-                    bbox_dict = line.get("bbox", {})
-                    keys = ["top_left", "top_right", "bottom_right", "bottom_left"]
-                    for k in keys:
-                        point = bbox_dict.get(k, [0, 0])
-                        bbox_flat.extend(point)
-
-                    lines.append(
-                        ai_service_pb2.OCRLine(
-                            text=line["text"],
-                            confidence=line["confidence"],
-                            bbox=bbox_flat,
-                        )
-                    )
+            result = await self.ocr_service.extract_text_async(
+                await self._image_data(request), lang
+            )
+
+            # Service already returns flat [x1, y1, ..., x4, y4] boxes
+            lines = [
+                ai_service_pb2.OCRLine(
+                    text=line["text"],
+                    confidence=line["confidence"],
+                    bbox=line["bbox"],
+                )
+                for line in result.get("lines", ())
+            ]
 
             logger.debug("OCR completed", request_id=request_id, lines=len(lines))
 
@@ -123,6 +223,32 @@ class AIService(ai_service_pb2_grpc.AIServiceServicer):
             logger.error(f"gRPC OCR failed: {e}", request_id=request_id)
             return ai_service_pb2.OCRResponse(success=False, message=str(e))
 
+    async def ExtractTextStream(
+        self, request: ai_service_pb2.OCRRequest, context: grpc.aio.ServicerContext
+    ):
+        request_id = self._get_request_id(context)
+        try:
+            lang = request.language if request.language else "en"
+
+            result = await self.ocr_service.extract_text_async(
+                await self._image_data(request), lang
+            )
+
+            lines = result.get("lines", ())
+            for line in lines:
+                yield ai_service_pb2.OCRLine(
+                    text=line["text"],
+                    confidence=line["confidence"],
+                    bbox=line["bbox"],
+                )
+
+            logger.debug(
+                "Streaming OCR completed", request_id=request_id, lines=len(lines)
+            )
+        except Exception as e:
+            logger.error(f"gRPC streaming OCR failed: {e}", request_id=request_id)
+            await context.abort(grpc.StatusCode.INTERNAL, str(e))
+
     async def TranscribeAudio(
         self, request: ai_service_pb2.AudioRequest, context: grpc.aio.ServicerContext
     ) -> ai_service_pb2.transcriptionResponse:
@@ -150,13 +276,37 @@ class AIService(ai_service_pb2_grpc.AIServiceServicer):
             logger.error(f"gRPC Transcription failed: {e}", request_id=request_id)
             return ai_service_pb2.transcriptionResponse(success=False, text=str(e))
 
+    async def TranscribeAudioStream(
+        self, request: ai_service_pb2.AudioRequest, context: grpc.aio.ServicerContext
+    ):
+        request_id = self._get_request_id(context)
+        filename = request.filename if request.filename else "audio.wav"
+        count = 0
+        try:
+            async for segment in self.transcription_service.transcribe_audio_stream(
+                request.audio_data, filename
+            ):
+                count += 1
+                yield ai_service_pb2.TranscriptionSegment(**segment)
+
+            logger.debug(
+                "Streaming transcription completed",
+                request_id=request_id,
+                segments=count,
+            )
+        except Exception as e:
+            logger.error(
+                f"gRPC streaming transcription failed: {e}", request_id=request_id
+            )
+            await context.abort(grpc.StatusCode.INTERNAL, str(e))
+
     async def VisualQuestionAnswering(
         self, request: ai_service_pb2.VQARequest, context: grpc.aio.ServicerContext
     ) -> ai_service_pb2.VQAResponse:
         request_id = self._get_request_id(context)
         try:
             answer = await self.vqa_service.answer_question_async(
-                request.image_data, request.question
+                await self._image_data(request), request.question
             )
 
             logger.debug(
@@ -173,24 +323,44 @@ class AIService(ai_service_pb2_grpc.AIServiceServicer):
 
 def cleanup_temp_files():
     """Clean up temporary files created during processing."""
-    temp_dir = tempfile.gettempdir()
-    patterns = ["*.wav", "*.mp3", "*.webm", "*.m4a"]
+    # One directory pass instead of a glob (listdir + match) per extension
+    suffixes = (".wav", ".mp3", ".webm", ".m4a")
 
     cleaned = 0
-    for pattern in patterns:
-        for filepath in glob.glob(os.path.join(temp_dir, f"tmp*{pattern}")):
-            try:
-                os.remove(filepath)
-                cleaned += 1
-            except OSError:
-                pass
+    with os.scandir(tempfile.gettempdir()) as entries:
+        for entry in entries:
+            name = entry.name
+            if name.startswith("tmp") and name.endswith(suffixes):
+                try:
+                    os.unlink(entry.path)
+                except OSError:
+                    pass
+                else:
+                    cleaned += 1
 
     if cleaned > 0:
         logger.info(f"Cleaned up {cleaned} temporary files")
 
 
-async def serve():
-    """Start Async gRPC Server with graceful shutdown support."""
+async def _warm_up(name: str, label: str, service) -> None:
+    """Load one service off the event loop and record it in model_status."""
+    loop = asyncio.get_running_loop()
+    try:
+        await loop.run_in_executor(None, service.load)
+        model_status[name]["ready"] = True
+        logger.info(f"{label} Loaded.")
+    except Exception as e:
+        model_status[name]["error"] = str(e)
+        logger.error(f"{label} load failed: {e}")
+
+
+async def serve(index: int = 0):
+    """
+    Start Async gRPC Server with graceful shutdown support.
+
+    Args:
+        index: Position of this process among GRPC_SERVER_PROCESSES
+    """
     global _server, model_status
 
     # Instantiate Services (Dependency Injection Root)
@@ -203,40 +373,16 @@ async def serve():
     # Warm up models with status tracking
     logger.info("Warming up models in gRPC process...")
 
-    try:
-        yolo_service.load()
-        model_status["yolo"]["ready"] = True
-        logger.info("YOLO Loaded.")
-    except Exception as e:
-        model_status["yolo"]["error"] = str(e)
-        logger.error(f"YOLO load failed: {e}")
-
-    try:
-        ocr_service.load()
-        model_status["ocr"]["ready"] = True
-        logger.info("OCR Loaded.")
-    except Exception as e:
-        model_status["ocr"]["error"] = str(e)
-        logger.error(f"OCR load failed: {e}")
-
-    try:
-        transcription_service.load()
-        model_status["whisper"]["ready"] = True
-        logger.info("Transcription Loaded.")
-    except Exception as e:
-        model_status["whisper"]["error"] = str(e)
-        logger.error(f"Whisper load failed: {e}")
-
-    try:
-        vqa_service.load()
-        model_status["vqa"]["ready"] = True
-        logger.info("VQA Loaded.")
-    except Exception as e:
-        model_status["vqa"]["error"] = str(e)
-        logger.error(f"VQA load failed: {e}")
+    # Loads are independent, so overlap their disk reads and graph setup
+    await asyncio.gather(
+        _warm_up("yolo", "YOLO", yolo_service),
+        _warm_up("ocr", "OCR", ocr_service),
+        _warm_up("whisper", "Transcription", transcription_service),
+        _warm_up("vqa", "VQA", vqa_service),
+    )
 
     # Create gRPC server
-    _server = grpc.aio.server()
+    _server = grpc.aio.server(options=GRPC_SERVER_OPTIONS)
     ai_service_pb2_grpc.add_AIServiceServicer_to_server(
         AIService(yolo_service, ocr_service, transcription_service, vqa_service),
         _server,
@@ -245,13 +391,26 @@ async def serve():
     listen_addr = "[::]:50051"
     _server.add_insecure_port(listen_addr)
 
-    logger.info(f"Starting gRPC server on {listen_addr}")
+    # Same-host clients skip the TCP stack through a unix socket; unix
+    # sockets cannot be shared, so only the first process listens on it
+    if settings.grpc_unix_socket and index == 0:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(settings.grpc_unix_socket)
+        _server.add_insecure_port(f"unix://{settings.grpc_unix_socket}")
+
+    # Drop directory for image_shm_path, so clients need not create it
+    os.makedirs(settings.grpc_shm_dir, exist_ok=True)
+
+    logger.info(
+        f"Starting gRPC server on {listen_addr}",
+        process_index=index,
+        uvloop=UVLOOP_AVAILABLE,
+        protobuf_backend=api_implementation.Type(),
+    )
 
     await _server.start()
 
     # Wait for shutdown signal or termination
-    import contextlib
-
     with contextlib.suppress(asyncio.CancelledError):
         await _shutdown_event.wait()
 
@@ -273,17 +432,24 @@ def handle_shutdown_signal(signum, frame):
     _shutdown_event.set()
 
 
-def run_server():
-    """Synchronous entry point for multiprocessing with signal handling."""
+def run_server(index: int = 0):
+    """
+    Synchronous entry point for multiprocessing with signal handling.
+
+    Args:
+        index: Position of this process among GRPC_SERVER_PROCESSES
+    """
     # Register signal handlers
     signal.signal(signal.SIGTERM, handle_shutdown_signal)
     signal.signal(signal.SIGINT, handle_shutdown_signal)
 
-    loop = asyncio.new_event_loop()
+    # libuv schedules grpc.aio's many small per-RPC callbacks faster; only
+    # this process's loop is replaced, not the HTTP server's policy
+    loop = uvloop.new_event_loop() if UVLOOP_AVAILABLE else asyncio.new_event_loop()
     asyncio.set_event_loop(loop)
 
     try:
-        loop.run_until_complete(serve())
+        loop.run_until_complete(serve(index))
     except KeyboardInterrupt:
         logger.info("KeyboardInterrupt received")
         _shutdown_event.set()
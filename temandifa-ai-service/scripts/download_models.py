@@ -4,6 +4,47 @@ from faster_whisper import download_model as download_whisper_model
 from paddleocr import PaddleOCR
 from ultralytics import YOLO
 
+# The service always letterboxes to this size (see app.utils.preprocessing)
+YOLO_IMGSZ = 640
+
+
+def pin_yolo_input_size(onnx_path: str, imgsz: int = YOLO_IMGSZ):
+    """
+    Fix the spatial dims of a dynamic YOLO export, keeping batch dynamic.
+
+    The DynamicBatcher sends 1..BATCH_MAX_SIZE images, so the batch axis has
+    to stay symbolic, but height/width never change. Pinning them lets
+    onnx-simplifier (and ORT at load time) fold the shape arithmetic of the
+    detection head and pick kernels for a known input size.
+    """
+    import onnx
+    from onnx.tools import update_model_dims
+
+    model = onnx.load(onnx_path)
+    output = model.graph.output[0]
+    channels = output.type.tensor_type.shape.dim[1]
+    anchors = sum((imgsz // stride) ** 2 for stride in (8, 16, 32))
+
+    # Stale symbolic shapes would otherwise block re-inference
+    del model.graph.value_info[:]
+    model = update_model_dims.update_inputs_outputs_dims(
+        model,
+        {model.graph.input[0].name: ["batch", 3, imgsz, imgsz]},
+        {output.name: ["batch", channels.dim_value or channels.dim_param, anchors]},
+    )
+
+    try:
+        import onnxsim
+
+        simplified, ok = onnxsim.simplify(model)
+        if ok:
+            model = simplified
+    except ImportError:
+        print("onnx-simplifier not installed, keeping unsimplified graph")
+
+    onnx.checker.check_model(model)
+    onnx.save(model, onnx_path)
+
 
 def download_models():
     print("--- Starting Model Downloads & Optimization ---")
@@ -12,12 +53,13 @@ def download_models():
     print("Downloading & Exporting YOLOv8 (yolov8n)...")
     try:
         model = YOLO("yolov8n.pt")
-        # Export to ONNX
+        # Export to ONNX (dynamic so batching works; spatial dims pinned below)
         success = model.export(
-            format="onnx", dynamic=True
-        )  # Dynamic shapes for flexibility
+            format="onnx", dynamic=True, imgsz=YOLO_IMGSZ, simplify=True, opset=17
+        )
         if success:
             print(f"YOLOv8 export successful: {success}")
+            pin_yolo_input_size(success)
             # Ensure it is in expected path /app/models/yolov8n.onnx
             # Ultralytics exports to same dir as .pt
             if os.path.exists("yolov8n.onnx"):
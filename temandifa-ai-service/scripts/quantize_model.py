@@ -6,10 +6,21 @@ Converts FP32 ONNX models to INT8 for faster inference.
 import argparse
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 
 try:
     import onnx
-    from onnxruntime.quantization import QuantType, quantize_dynamic
+    from onnxruntime.quantization import (
+        CalibrationDataReader,
+        QuantFormat,
+        QuantType,
+        create_calibrator,
+        quantize_dynamic,
+        quantize_static,
+        write_calibration_table,
+    )
+    from onnxruntime.quantization.shape_inference import quant_pre_process
 except ImportError:
     print("Error: Required packages not installed.")
     print("Install with: pip install onnx onnxruntime")
@@ -62,6 +73,89 @@ def get_model_info(model_path: str) -> dict:
     }
 
 
+def preprocess_model(input_path: str) -> str:
+    """
+    Prepare a model for quantization with ORT's quant_pre_process.
+
+    Runs symbolic shape inference, constant folding and operator fusion so
+    the quantizer sees a smaller, fully shaped graph. Replaces the
+    deprecated optimize_model option of the quantize_* functions.
+
+    Returns:
+        Path of the pre-processed model (caller removes it)
+    """
+    preprocessed_path = os.path.splitext(input_path)[0] + ".preproc.onnx"
+    print("\n🔧 Pre-processing model (shape inference + optimization)...")
+    quant_pre_process(input_path, preprocessed_path, skip_symbolic_shape=False)
+    return preprocessed_path
+
+
+def yolo_calibration_reader(
+    model_path: str, images_dir: str, max_images: int
+) -> CalibrationDataReader | None:
+    """
+    Build a calibration data reader over sample images for YOLOv8.
+
+    Images get the same letterbox + RGB + 1/255 preprocessing as the service.
+    Returns None (after printing why) if OpenCV or the images are missing.
+    """
+    try:
+        import cv2
+        import numpy as np
+    except ImportError:
+        print("✗ Error: opencv-python is required for calibration.")
+        return None
+
+    # Letterboxing with the service's gray border needs borderValue
+    dnn = getattr(cv2, "dnn", None)
+    if not (
+        hasattr(dnn, "blobFromImageWithParams")
+        and hasattr(dnn, "Image2BlobParams")
+        and hasattr(dnn.Image2BlobParams(), "borderValue")
+    ):
+        print(
+            f"✗ Error: OpenCV >= 4.10 is required for calibration (found {cv2.__version__})."
+        )
+        return None
+
+    if not os.path.isdir(images_dir):
+        print(f"✗ Error: Calibration images directory not found: {images_dir}")
+        return None
+
+    image_paths = sorted(
+        os.path.join(images_dir, name)
+        for name in os.listdir(images_dir)
+        if name.lower().endswith((".jpg", ".jpeg", ".png", ".webp"))
+    )[:max_images]
+    if not image_paths:
+        print(f"✗ Error: No calibration images found in {images_dir}")
+        return None
+
+    input_name = onnx.load(model_path).graph.input[0].name
+
+    params = cv2.dnn.Image2BlobParams()
+    params.scalefactor = (1 / 255.0,) * 3
+    params.size = (640, 640)
+    params.swapRB = True
+    params.paddingmode = cv2.dnn.DNN_PMODE_LETTERBOX
+    params.borderValue = (114, 114, 114)
+
+    class YoloCalibrationReader(CalibrationDataReader):
+        def __init__(self):
+            self.paths = iter(image_paths)
+
+        def get_next(self):
+            for path in self.paths:
+                image = cv2.imread(path)
+                if image is not None:
+                    blob = cv2.dnn.blobFromImageWithParams(image, params)
+                    return {input_name: blob.astype(np.float32)}
+            return None
+
+    print(f"\n📷 Calibrating with {len(image_paths)} images from {images_dir}")
+    return YoloCalibrationReader()
+
+
 def quantize_model_dynamic(
     input_path: str,
     output_path: str,
@@ -82,7 +176,7 @@ def quantize_model_dynamic(
         weight_type: Weight type - "uint8" or "int8"
         per_channel: Use per-channel quantization for better accuracy
         reduce_range: Use 7-bit quantization for better compatibility
-        optimize_model: Apply graph optimizations before quantization
+        optimize_model: Pre-process the model (see preprocess_model) first
 
     Returns:
         True if successful, False otherwise
@@ -124,15 +218,18 @@ def quantize_model_dynamic(
     print(f"  - Optimize: {optimize_model}")
 
     # Perform quantization
-    print("\n🔄 Quantizing model...")
+    model_input = input_path
     try:
+        if optimize_model:
+            model_input = preprocess_model(input_path)
+
+        print("\n🔄 Quantizing model...")
         quantize_dynamic(
-            model_input=input_path,
+            model_input=model_input,
             model_output=output_path,
             weight_type=quant_type,
             per_channel=per_channel,
             reduce_range=reduce_range,
-            optimize_model=optimize_model,
         )
 
         # Validate output model
@@ -159,9 +256,129 @@ def quantize_model_dynamic(
         traceback.print_exc()
         return False
 
+    finally:
+        if model_input != input_path and os.path.exists(model_input):
+            os.remove(model_input)
+
+
+def quantize_model_static(
+    input_path: str,
+    output_path: str,
+    images_dir: str,
+    max_images: int = 100,
+    per_channel: bool = True,
+) -> bool:
+    """
+    Perform static quantization on a YOLOv8 ONNX model.
+
+    Unlike dynamic quantization, activations are quantized too, using
+    ranges collected from calibration images, so convolutions run as INT8
+    kernels (VNNI on supporting CPUs). Uses the QDQ format with signed
+    INT8 weights and activations.
+
+    Args:
+        input_path: Path to input FP32 ONNX model
+        output_path: Path for output quantized model
+        images_dir: Directory of representative images for calibration
+        max_images: Maximum number of calibration images to use
+        per_channel: Use per-channel weight quantization for better accuracy
+
+    Returns:
+        True if successful, False otherwise
+    """
+    print(f"\n{'='*60}")
+    print("ONNX Model Static Quantization")
+    print(f"{'='*60}")
+    print(f"Input:  {input_path}")
+    print(f"Output: {output_path}")
+    print(f"{'='*60}\n")
+
+    if not os.path.exists(input_path):
+        print(f"✗ Error: Input model not found: {input_path}")
+        return False
+
+    if not validate_onnx_model(input_path):
+        return False
+
+    reader = yolo_calibration_reader(input_path, images_dir, max_images)
+    if reader is None:
+        return False
+
+    print("\n⚙️  Quantization Settings:")
+    print("  - Format: QDQ")
+    print("  - Weights / Activations: int8 / int8")
+    print(f"  - Per-Channel: {per_channel}")
+
+    model_input = input_path
+    try:
+        model_input = preprocess_model(input_path)
+
+        print("\n🔄 Quantizing model...")
+        quantize_static(
+            model_input=model_input,
+            model_output=output_path,
+            calibration_data_reader=reader,
+            quant_format=QuantFormat.QDQ,
+            activation_type=QuantType.QInt8,
+            weight_type=QuantType.QInt8,
+            per_channel=per_channel,
+        )
+
+        if not validate_onnx_model(output_path):
+            return False
+
+        input_size = os.path.getsize(input_path) / (1024 * 1024)
+        output_size = os.path.getsize(output_path) / (1024 * 1024)
+
+        print("\n✅ Quantization completed successfully!")
+        print("\n📦 Size Comparison:")
+        print(f"  - Original:   {input_size:.2f} MB")
+        print(f"  - Quantized:  {output_size:.2f} MB")
+        return True
+
+    except Exception as e:
+        print(f"✗ Quantization failed: {e}")
+        import traceback
+
+        traceback.print_exc()
+        return False
+
+    finally:
+        if model_input != input_path and os.path.exists(model_input):
+            os.remove(model_input)
+
+
+def save_optimized_graph(model_path: str, device: str = "cpu") -> bool:
+    """
+    Save the ORT_ENABLE_ALL-optimized graph next to a model.
+
+    Uses the same <model>.<device>.opt.onnx name YoloService caches at
+    startup, so the service loads it directly instead of re-running the
+    graph optimizer in every worker process. The saved graph can contain
+    CPU-specific layouts, so run this on the hardware that serves it.
+    """
+    import onnxruntime as ort
+
+    optimized_path = f"{os.path.splitext(model_path)[0]}.{device}.opt.onnx"
+    print(f"\n🔧 Saving optimized graph: {optimized_path}")
+    try:
+        so = ort.SessionOptions()
+        so.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        so.optimized_model_filepath = optimized_path
+        ort.InferenceSession(model_path, so, providers=["CPUExecutionProvider"])
+        return True
+    except Exception as e:
+        print(f"✗ Saving optimized graph failed: {e}")
+        return False
+
 
-def quantize_yolo(models_dir: str = "models"):
-    """Quantize YOLOv8 model specifically."""
+def quantize_yolo(models_dir: str = "models", images_dir: str | None = None):
+    """
+    Quantize YOLOv8 model specifically.
+
+    With a calibration images directory the model is statically quantized
+    (INT8 activations too); otherwise it falls back to dynamic quantization.
+    """
     input_path = os.path.join(models_dir, "yolov8n.onnx")
     output_path = os.path.join(models_dir, "yolov8n_int8.onnx")
 
@@ -172,13 +389,132 @@ def quantize_yolo(models_dir: str = "models"):
         print(f"   yolo export model={pt_path} format=onnx")
         return False
 
-    return quantize_model_dynamic(
-        input_path=input_path,
-        output_path=output_path,
-        weight_type="uint8",
-        per_channel=True,
-        reduce_range=True,
-    )
+    if images_dir:
+        success = quantize_model_static(input_path, output_path, images_dir)
+    else:
+        success = quantize_model_dynamic(
+            input_path=input_path,
+            output_path=output_path,
+            weight_type="uint8",
+            per_channel=True,
+            reduce_range=True,
+        )
+
+    return success and save_optimized_graph(output_path)
+
+
+def convert_yolo_fp16(models_dir: str = "models") -> bool:
+    """
+    Convert YOLOv8 ONNX model to FP16 for CUDA inference.
+
+    Inputs and outputs are converted too, so the service feeds FP16 tensors
+    directly (see ENABLE_FP16).
+    """
+    try:
+        from onnxconverter_common import float16
+    except ImportError:
+        print("✗ Error: onnxconverter-common not installed.")
+        print("Install with: pip install onnxconverter-common")
+        return False
+
+    input_path = os.path.join(models_dir, "yolov8n.onnx")
+    output_path = os.path.join(models_dir, "yolov8n_fp16.onnx")
+
+    if not os.path.exists(input_path):
+        print(f"✗ Error: Input model not found: {input_path}")
+        return False
+
+    if not validate_onnx_model(input_path):
+        return False
+
+    print(f"\n🔄 Converting to FP16: {input_path} -> {output_path}")
+    try:
+        model = onnx.load(input_path)
+        model_fp16 = float16.convert_float_to_float16(model, keep_io_types=False)
+        onnx.save(model_fp16, output_path)
+
+        if not validate_onnx_model(output_path):
+            return False
+
+        input_size = os.path.getsize(input_path) / (1024 * 1024)
+        output_size = os.path.getsize(output_path) / (1024 * 1024)
+        print("\n✅ FP16 conversion completed successfully!")
+        print(f"  - Original: {input_size:.2f} MB")
+        print(f"  - FP16:     {output_size:.2f} MB")
+        return True
+
+    except Exception as e:
+        print(f"✗ FP16 conversion failed: {e}")
+        return False
+
+
+def calibrate_yolo_trt(
+    models_dir: str = "models",
+    images_dir: str = "calibration_images",
+    cache_dir: str = "models/trt_cache",
+    max_images: int = 200,
+) -> bool:
+    """
+    Build the TensorRT INT8 calibration table for YOLOv8.
+
+    Runs representative images through the FP32 model and writes
+    calibration.flatbuffers to the TensorRT cache directory, where the
+    service reads it when ENABLE_TENSORRT and ENABLE_QUANTIZATION are set.
+    """
+    input_path = os.path.join(models_dir, "yolov8n.onnx")
+    if not os.path.exists(input_path):
+        print(f"✗ Error: Input model not found: {input_path}")
+        return False
+
+    reader = yolo_calibration_reader(input_path, images_dir, max_images)
+    if reader is None:
+        return False
+
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        augmented_path = os.path.join(cache_dir, "augmented_model.onnx")
+        calibrator = create_calibrator(input_path, augmented_model_path=augmented_path)
+        calibrator.collect_data(reader)
+        write_calibration_table(calibrator.compute_data(), dir=cache_dir)
+        os.remove(augmented_path)
+
+        print("\n✅ Calibration table written!")
+        print(f"  - {os.path.join(cache_dir, 'calibration.flatbuffers')}")
+        return True
+
+    except Exception as e:
+        print(f"✗ Calibration failed: {e}")
+        return False
+
+
+def _quantize_one(input_path: str, **kwargs) -> tuple[str, bool]:
+    """Dynamically quantize one model to <name>_int8.onnx (process pool worker)."""
+    output_path = f"{os.path.splitext(input_path)[0]}_int8.onnx"
+    return input_path, quantize_model_dynamic(input_path, output_path, **kwargs)
+
+
+def quantize_models_parallel(input_paths: list[str], **kwargs) -> bool:
+    """
+    Dynamically quantize several independent models in parallel.
+
+    Each model runs in its own process, so the Python-heavy parts of the
+    quantizer do not contend for one GIL.
+
+    Args:
+        input_paths: FP32 ONNX models; each is written next to its input
+        **kwargs: Options passed to quantize_model_dynamic
+
+    Returns:
+        True if every model was quantized
+    """
+    max_workers = min(len(input_paths), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(partial(_quantize_one, **kwargs), input_paths))
+
+    print("\n📋 Summary:")
+    for path, ok in results:
+        print(f"  {'✓' if ok else '✗'} {path}")
+    return all(ok for _, ok in results)
 
 
 def main():
@@ -189,18 +525,48 @@ def main():
 Examples:
   # Quantize YOLOv8 model
   python quantize_model.py --yolo
+
+  # Statically quantize YOLOv8 (INT8 activations) from sample images
+  python quantize_model.py --yolo --static --images-dir calibration_images
   
+  # Convert YOLOv8 model to FP16 (CUDA)
+  python quantize_model.py --yolo-fp16
+
+  # Build TensorRT INT8 calibration table from sample images
+  python quantize_model.py --yolo-trt-calibration --images-dir calibration_images
+
   # Quantize custom model
   python quantize_model.py -i model.onnx -o model_int8.onnx
   
+  # Quantize several models in parallel (writes <name>_int8.onnx)
+  python quantize_model.py --inputs a.onnx b.onnx c.onnx
+
   # Quantize with specific settings
   python quantize_model.py -i model.onnx -o model_int8.onnx \\\n      --weight-type int8 --no-per-channel
         """,
     )
 
     parser.add_argument("--yolo", action="store_true", help="Quantize YOLOv8 model")
+    parser.add_argument(
+        "--yolo-fp16", action="store_true", help="Convert YOLOv8 model to FP16"
+    )
+    parser.add_argument(
+        "--yolo-trt-calibration",
+        action="store_true",
+        help="Build TensorRT INT8 calibration table for YOLOv8",
+    )
+    parser.add_argument(
+        "--static",
+        action="store_true",
+        help="Static quantization calibrated on --images-dir",
+    )
+    parser.add_argument("--images-dir", type=str, default="calibration_images")
+    parser.add_argument("--trt-cache-dir", type=str, default="models/trt_cache")
     parser.add_argument("-i", "--input", type=str, help="Input ONNX model path")
     parser.add_argument("-o", "--output", type=str, help="Output quantized model path")
+    parser.add_argument(
+        "--inputs", nargs="+", help="Input ONNX models to quantize in parallel"
+    )
     parser.add_argument("--weight-type", choices=["uint8", "int8"], default="uint8")
     parser.add_argument("--no-per-channel", action="store_true")
     parser.add_argument("--no-reduce-range", action="store_true")
@@ -210,7 +576,30 @@ Examples:
     args = parser.parse_args()
 
     if args.yolo:
-        success = quantize_yolo(args.models_dir)
+        success = quantize_yolo(
+            args.models_dir, args.images_dir if args.static else None
+        )
+    elif args.yolo_fp16:
+        success = convert_yolo_fp16(args.models_dir)
+    elif args.yolo_trt_calibration:
+        success = calibrate_yolo_trt(
+            args.models_dir, args.images_dir, args.trt_cache_dir
+        )
+    elif args.inputs:
+        success = quantize_models_parallel(
+            args.inputs,
+            weight_type=args.weight_type,
+            per_channel=not args.no_per_channel,
+            reduce_range=not args.no_reduce_range,
+            optimize_model=not args.no_optimize,
+        )
+    elif args.input and args.output and args.static:
+        success = quantize_model_static(
+            input_path=args.input,
+            output_path=args.output,
+            images_dir=args.images_dir,
+            per_channel=not args.no_per_channel,
+        )
     elif args.input and args.output:
         success = quantize_model_dynamic(
             input_path=args.input,
@@ -222,7 +611,7 @@ Examples:
         )
     else:
         parser.print_help()
-        print("\n⚠️  Please specify --yolo or provide -i and -o paths")
+        print("\n⚠️  Please specify --yolo, --inputs, or provide -i and -o paths")
         sys.exit(1)
 
     sys.exit(0 if success else 1)